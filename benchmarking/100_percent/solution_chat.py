@@ -28,7 +28,12 @@
 #
 # Verified: S(2)=6, S(5)=58, S(20)=122087.
 
+import os
 import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # repo root
+from eulerlib import modcomb, sieve
+
 sys.setrecursionlimit(1_000_000)
 
 MOD = 998244353
@@ -163,15 +168,7 @@ def poly_exp(f, n, inv_ints):
 ############################
 
 def primes_upto(n):
-    sieve = bytearray(b'\x01') * (n + 1)
-    sieve[0:2] = b'\x00\x00'
-    import math
-    for p in range(2, int(math.isqrt(n)) + 1):
-        if sieve[p]:
-            step = p
-            start = p * p
-            sieve[start:n + 1:step] = b'\x00' * (((n - start) // step) + 1)
-    return [i for i in range(2, n + 1) if sieve[i]]
+    return sieve.primes_upto(n).tolist()
 
 def count_phi_odd_preimages(N):
     """
@@ -285,10 +282,7 @@ def parity_factor(N):
 def S(n: int) -> int:
     N = 2 * n
     # inverses 1..N for integration / log-series
-    inv_ints = [0] * (N + 1)
-    inv_ints[1] = 1
-    for i in range(2, N + 1):
-        inv_ints[i] = MOD - (MOD // i) * inv_ints[MOD % i] % MOD
+    inv_ints = modcomb.tables(MOD).ensure(N).inv[:N + 1].tolist()
 
     # counts of odd m with φ(m) ≤ N
     b = count_phi_odd_preimages(N)  # includes m=1 at t=1
@@ -307,6 +301,9 @@ def S(n: int) -> int:
     final = poly_mul(G_odd, B_even, n=N + 1)
     return final[N] % MOD
 
+def solve(n: int = 10_000) -> int:
+    return S(n)
+
 def main():
     # quick self-checks
     checks = {2: 6, 5: 58, 20: 122087}
@@ -316,7 +313,8 @@ def main():
             print(f"[check failed] S({t}) = {got}, expected {want}")
             sys.exit(1)
     # final answer
-    print(S(10_000))
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    print(solve(n))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,4 +1,9 @@
-from math import factorial
+import os
+import sys
+from math import comb
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # repo root
+from eulerlib.multinomial import multinomial_power_sums
 
 def S(k: int) -> int:
     """
@@ -7,40 +12,27 @@ def S(k: int) -> int:
     (no leading zeros allowed).
 
     Uses the identity:
-        S(k) = sum_over_multisets C(P, 2)
+        S(k) = sum_over_multisets C(P, 2) = (sum P^2 - sum P) / 2
     with
         P = ((k-1)! * (k - c0)) / (prod_d c_d!)
-    where c0 is the count of zeros in the multiset (and sum c_d = k).
-    """
-    fact = [1] * (k + 1)
-    for i in range(2, k + 1):
-        fact[i] = fact[i - 1] * i
-
-    total = 0
-    k_1_fact = fact[k - 1]
+          = C(k-1, s-1) * multinomial(s; c1..c9),   s = k - c0 nonzero digits.
 
-    # Let s = k - c0 be the number of nonzero digits. s >= 1.
-    # For each s, enumerate compositions of s into 9 parts (c1..c9).
-    for s in range(1, k + 1):
-        c0 = k - s
-        denom0 = fact[c0]
-
-        # Recursively assign counts for digits 1..8; c9 is determined at the leaf.
-        def rec(pos: int, rem: int, denom_prod: int) -> None:
-            nonlocal total
-            if pos == 8:  # digits 1..8 assigned; digit 9 gets 'rem'
-                denom_all_nonzero = denom_prod * fact[rem]
-                denom_total = denom0 * denom_all_nonzero
-                P = (k_1_fact * s) // denom_total  # always integer
-                total += P * (P - 1) // 2
-                return
-            for v in range(rem + 1):
-                rec(pos + 1, rem - v, denom_prod * fact[v])
-
-        rec(0, s, 1)
+    sum P counts every k-digit number once: 9 * 10^(k-1). For sum P^2, group
+    the multisets by s: the squared multinomials of s over the 9 nonzero
+    digits sum to g_s (eulerlib.multinomial), so
+        sum P^2 = sum_{s=1}^{k} C(k-1, s-1)^2 * g_s,
+    an O(k^2) pass instead of C(k+9, 9) multisets.
+    """
+    if k < 1:
+        return 0
+    g = multinomial_power_sums(9, k)
+    sum_sq = sum(comb(k - 1, s - 1) ** 2 * g[s] for s in range(1, k + 1))
+    return (sum_sq - 9 * 10 ** (k - 1)) // 2
 
-    return total
+def solve(k: int = 12) -> int:
+    return S(k)
 
 if __name__ == "__main__":
-    # Compute and print S(12)
-    print(S(12))
+    # Compute and print S(k), k=12 unless given on the command line
+    k = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    print(S(k))
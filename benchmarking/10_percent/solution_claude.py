@@ -1,3 +1,4 @@
+import sys
 from math import factorial
 
 
@@ -49,23 +50,29 @@ def S(k):
     return total
 
 
-# Verify with the given test case
-test_result = S(3)
-print(f"S(3) = {test_result}")
-assert test_result == 1701, f"Test failed: expected 1701, got {test_result}"
+def solve(k=12):
+    return S(k)
 
-# Calculate the answer
-answer = S(12)
-print(f"\nS(12) = {answer}")
 
-# Brief explanation
-print("\n--- Explanation ---")
-print("This solution groups k-digit numbers by their digit multisets.")
-print("For each multiset, we calculate how many valid k-digit numbers can be formed,")
-print("then sum C(count, 2) across all multisets, since within each multiset,")
-print("the sum of T(n) equals the number of ordered pairs where one number > another.")
-print("\nKey techniques:")
-print("- Combinatorial grouping by digit multisets")
-print("- Multinomial coefficients for counting permutations")
-print("- Efficient generation of integer compositions")
-print("- Mathematical insight that sum of T(n) within a group = C(group_size, 2)")
\ No newline at end of file
+if __name__ == "__main__":
+    # Verify with the given test case
+    test_result = S(3)
+    print(f"S(3) = {test_result}")
+    assert test_result == 1701, f"Test failed: expected 1701, got {test_result}"
+
+    # Calculate the answer
+    k = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    answer = solve(k)
+    print(f"\nS({k}) = {answer}")
+
+    # Brief explanation
+    print("\n--- Explanation ---")
+    print("This solution groups k-digit numbers by their digit multisets.")
+    print("For each multiset, we calculate how many valid k-digit numbers can be formed,")
+    print("then sum C(count, 2) across all multisets, since within each multiset,")
+    print("the sum of T(n) equals the number of ordered pairs where one number > another.")
+    print("\nKey techniques:")
+    print("- Combinatorial grouping by digit multisets")
+    print("- Multinomial coefficients for counting permutations")
+    print("- Efficient generation of integer compositions")
+    print("- Mathematical insight that sum of T(n) within a group = C(group_size, 2)")
\ No newline at end of file
@@ -1,4 +1,5 @@
 import math
+import sys
 
 
 class PermutationSumSolver:
@@ -77,11 +78,17 @@ class PermutationSumSolver:
         return self.total_S
 
 
-def main():
+def solve(k=12):
+    """
+    Returns S(k) without printing anything.
+    """
+    return PermutationSumSolver(k).solve()
+
+
+def main(K_VALUE=12):
     """
     Main function to solve the problem for S(12) and print the explanation and answer.
     """
-    K_VALUE = 12
 
     # --- Brief Explanation ---
     explanation_summary = (
@@ -101,11 +108,10 @@ def main():
     print(explanation_summary)
     print(explanation_techniques)
 
-    solver = PermutationSumSolver(K_VALUE)
-    result = solver.solve()
+    result = solve(K_VALUE)
 
     print(f"\nThe final answer for S({K_VALUE}) is: {result}")
 
 
 if __name__ == "__main__":
-    main()
+    main(*map(int, sys.argv[1:]))
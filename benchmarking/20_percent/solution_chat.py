@@ -1,5 +1,7 @@
 # Computes X(10^18) for Project Euler "XOR-product" problem.
 
+import sys
+
 def X_of_N(N: int) -> int:
     # Polynomials over GF(2) are bitmasks: bit i is coeff of x^i.
     # Recurrence for t^n = A_n + t*B_n in GF(2)[t, t^{-1}]:
@@ -21,12 +23,16 @@ def X_of_N(N: int) -> int:
     return ans
 
 
-def main():
+def solve(N: int = 10**18) -> int:
+    return X_of_N(N)
+
+
+def main(N=10**18):
     # Optional sanity check from the statement:
     assert X_of_N(10) == 5
     # The requested value:
-    print(X_of_N(10**18))
+    print(solve(N))
 
 
 if __name__ == "__main__":
-    main()
+    main(*map(int, sys.argv[1:]))
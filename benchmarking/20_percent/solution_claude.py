@@ -1,3 +1,7 @@
+import sys
+from collections import defaultdict
+
+
 def xor_product(a, b):
     """Compute the XOR-product of a and b."""
     result = 0
@@ -32,38 +36,49 @@ def find_solutions(limit):
     return solutions
 
 
-# Find solutions up to 10
-print("Finding solutions with b <= 10:")
-solutions_10 = find_solutions(10)
+def x_from_solutions(solutions, N=10 ** 18):
+    """XOR of all b <= N over the found solutions."""
+    X = 0
+    for a, b in solutions:
+        if b <= N:
+            X ^= b
+    return X
 
-# Calculate X(10)
-X_10 = 0
-for a, b in solutions_10:
-    X_10 ^= b
 
-print(f"\nSolutions with b <= 10: {solutions_10}")
-print(f"X(10) = {X_10}")
+def solve(limit=1000):
+    return x_from_solutions(find_solutions(limit))
 
-# Now search more broadly for all solutions
-print("\nSearching for all solutions up to 1000:")
-all_solutions = find_solutions(1000)
 
-# Group by b value to see pattern
-from collections import defaultdict
+if __name__ == "__main__":
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    # Find solutions up to 10
+    print("Finding solutions with b <= 10:")
+    solutions_10 = find_solutions(10)
+
+    # Calculate X(10)
+    X_10 = 0
+    for a, b in solutions_10:
+        X_10 ^= b
+
+    print(f"\nSolutions with b <= 10: {solutions_10}")
+    print(f"X(10) = {X_10}")
+
+    # Now search more broadly for all solutions
+    print(f"\nSearching for all solutions up to {limit}:")
+    all_solutions = find_solutions(limit)
 
-b_values = defaultdict(list)
-for a, b in all_solutions:
-    b_values[b].append(a)
+    # Group by b value to see pattern
+    b_values = defaultdict(list)
+    for a, b in all_solutions:
+        b_values[b].append(a)
 
-print(f"\nTotal solutions found: {len(all_solutions)}")
-print("\nB values and their corresponding A values:")
-for b in sorted(b_values.keys())[:20]:  # Show first 20 b values
-    print(f"  b={b}: a={b_values[b]}")
+    print(f"\nTotal solutions found: {len(all_solutions)}")
+    print("\nB values and their corresponding A values:")
+    for b in sorted(b_values.keys())[:20]:  # Show first 20 b values
+        print(f"  b={b}: a={b_values[b]}")
 
-# Calculate X(10^18)
-X_large = 0
-for a, b in all_solutions:
-    if b <= 10 ** 18:
-        X_large ^= b
+    # Calculate X(10^18)
+    X_large = x_from_solutions(all_solutions)
 
-print(f"\nX(10^18) = {X_large}")
\ No newline at end of file
+    print(f"\nX(10^18) = {X_large}")
@@ -1,7 +1,11 @@
+import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # repo root
+from eulerlib.linrec import nth_term_gf2x
 
-def solve():
+
+def solve(N=10 ** 18):
     """
     This function solves Project Euler Problem 343 by generating solutions
     from a linear recurrence relation and calculating their XOR sum.
@@ -17,38 +21,18 @@ def solve():
     for n >= 0, as long as v_{n+1} <= N. We need to find the XOR sum of the
     'b' values, which are the terms v_1, v_2, v_3, ... up to N.
     """
-    N = 10 ** 18
-
-    # Initialize the first two terms of the sequence
-    v_prev = 0  # This represents v_0
-    v_curr = 3  # This represents v_1
-
-    # The 'b' values in the solutions (a,b) are v_1, v_2, v_3, ...
-    # We compute the XOR sum of these values up to the limit N.
-    xor_sum_of_b = 0
-
-    # The first 'b' value is v_1
-    if v_curr <= N:
-        xor_sum_of_b ^= v_curr
-
-    # Generate subsequent terms and update the XOR sum
-    while True:
-        # Calculate the next term in the sequence
-        v_next = (v_curr << 1) ^ v_prev
-
-        # Stop if the term exceeds the limit N
-        if v_next > N:
-            break
-
-        # Include the new term in the XOR sum
-        xor_sum_of_b ^= v_next
-
-        # Update the terms for the next iteration
-        v_prev = v_curr
-        v_curr = v_next
-
-    print(xor_sum_of_b)
-
+    # v_n has degree n, so 2^n <= v_n < 2^(n+1): the last term <= N is
+    # v_n with n = bit_length(N) - 1, or the one before it.
+    n = N.bit_length() - 1
+    if n >= 1 and nth_term_gf2x([2, 1], [0, 3], n) > N:
+        n -= 1
+    if n < 1:
+        return 0
+
+    # The running XOR S_n = v_1 ^ ... ^ v_n is itself a linear recurrence over
+    # GF(2)[x], with characteristic polynomial (t + 1)(t^2 + x t + 1):
+    # S_n = (x+1) S_{n-1} + (x+1) S_{n-2} + S_{n-3}, from S_0, S_1, S_2 = 0, 3, 5.
+    return nth_term_gf2x([3, 3, 1], [0, 3, 5], n)
 
 if __name__ == "__main__":
-    solve()
+    print(solve(*map(int, sys.argv[1:])))
@@ -4,8 +4,9 @@
 #   2) Integer-ize block slopes with a second merging pass.
 #   3) B = sum_i i*(A*_i - S_i) = P_final - P_initial.
 
-def main():
-    N = 10_000_000
+import sys
+
+def solve(N=10_000_000):
     MOD = 50515093
     x = 290_797
 
@@ -95,7 +96,7 @@ def main():
 
     # Number of steps
     B = P_final - P_init
-    print(B)
+    return B
 
 if __name__ == "__main__":
-    main()
+    print(solve(*map(int, sys.argv[1:])))
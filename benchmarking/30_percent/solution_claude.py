@@ -1,5 +1,7 @@
-def solve():
-    N = 10 ** 7
+import sys
+
+
+def solve(N=10 ** 7):
 
     # Generate sequence S_n = S_{n-1}^2 mod 50515093
     S = [0] * N
@@ -24,4 +26,5 @@ def solve():
     return total_steps
 
 
-print(solve())
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve(*map(int, sys.argv[1:])))
\ No newline at end of file
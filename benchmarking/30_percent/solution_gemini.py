@@ -1,11 +1,13 @@
-def solve():
+import sys
+
+
+def solve(N=10**7):
     """
     Solves the Project Euler problem by calculating the difference between the sum of
     initial cumulative bean counts and the sum of final (sorted) cumulative bean counts.
     The final state is determined by the lower convex hull of the initial state's
     cumulative sum graph.
     """
-    N = 10**7
     MOD = 50515093
     s_initial = 290797
 
@@ -69,7 +71,7 @@ def solve():
 
     # Step 4: The total number of steps is the difference between the two sums.
     result = sum_CS - sum_CF
-    print(result)
+    return result
 
 if __name__ == "__main__":
-    solve()
+    print(solve(*map(int, sys.argv[1:])))
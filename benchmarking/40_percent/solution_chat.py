@@ -1,10 +1,43 @@
 # Project Euler — Pisano-period product
 # P(1_000_000) mod 1_234_567_891
 
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # repo root
+from eulerlib.fibonacci import fib_lucas
+
 MOD = 1_234_567_891
 N = 1_000_000
 
-def solve(n: int, mod: int) -> int:
+def chunk_product(lo: int, hi: int, mod: int = MOD) -> int:
+    """
+    ∏_{t=lo}^{hi-1} ( L_t if t odd else F_t )  (mod mod), for 1 <= lo <= hi.
+
+    The starting pairs come from fast doubling, so any chunk can be
+    evaluated on its own: F_(lo-1), F_lo directly, and
+    L_(lo-1) = 2 F_lo - F_(lo-1), L_lo = 2 F_(lo-1) + F_lo.
+    """
+    F_prev, F_curr, L_prev = fib_lucas(lo - 1, mod)
+    L_curr = (2 * F_prev + F_curr) % mod
+
+    prod = 1 % mod
+    # Iterate t = lo..hi-1, multiplying the required term each time
+    for t in range(lo, hi):
+        if t & 1:              # t odd -> use L_t
+            prod = (prod * L_curr) % mod
+        else:                  # t even -> use F_t
+            prod = (prod * F_curr) % mod
+
+        # Step the recurrences modulo mod
+        F_prev, F_curr = F_curr, (F_prev + F_curr) % mod
+        L_prev, L_curr = L_curr, (L_prev + L_curr) % mod
+
+    return prod
+
+def solve(n: int = N, mod: int = MOD, workers: int = 1) -> int:
     """
     Uses the identity:
       For p = 2t:
@@ -14,29 +47,29 @@ def solve(n: int, mod: int) -> int:
 
     Therefore:
       P(n) = 2 * ∏_{t=1}^{⌊n/2⌋} ( L_t if t odd else F_t )   (mod MOD)
+
+    With workers > 1 the t-range is cut into 4 chunks per worker and the
+    partial products come from a process pool; the chunks cost the same,
+    so the speedup is close to the number of cores. The pool is forked: the
+    workers look chunk_product up by module name, and a forked worker has
+    this module even when it was loaded from its path under a made-up name
+    (harness.inprocess does that), which spawn and forkserver workers cannot
+    re-import. Where fork is unavailable the product is computed serially.
     """
     T = n // 2
 
-    # Fibonacci: F_0=0, F_1=1
-    F_prev, F_curr = 0, 1
-    # Lucas: L_0=2, L_1=1
-    L_prev, L_curr = 2, 1
-
     ans = 1
     if n >= 3:                 # account for M(3)=2
         ans = (ans * 2) % mod
 
-    # Iterate t = 1..T, multiplying the required term each time
-    for t in range(1, T + 1):
-        if t & 1:              # t odd -> use L_t
-            ans = (ans * L_curr) % mod
-        else:                  # t even -> use F_t
-            ans = (ans * F_curr) % mod
-
-        # Step the recurrences modulo mod
-        F_prev, F_curr = F_curr, (F_prev + F_curr) % mod
-        L_prev, L_curr = L_curr, (L_prev + L_curr) % mod
+    if workers <= 1 or T < 1 or "fork" not in multiprocessing.get_all_start_methods():
+        return (ans * chunk_product(1, T + 1, mod)) % mod
 
+    chunks = min(4 * workers, T)
+    bounds = [1 + T * i // chunks for i in range(chunks + 1)]
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork")) as pool:
+        for part in pool.map(chunk_product, bounds[:-1], bounds[1:], [mod] * chunks):
+            ans = (ans * part) % mod
     return ans
 
 if __name__ == "__main__":
@@ -44,4 +77,6 @@ if __name__ == "__main__":
     # (uncomment to verify)
     # print("P(10) =", solve(10, MOD))  # -> 264
 
-    print(solve(N, MOD))
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    print(solve(n, MOD, workers))
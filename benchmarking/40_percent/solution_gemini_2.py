@@ -1,232 +1,64 @@
+import os
 import sys
-from collections import defaultdict
 
+import numpy as np
 
-def solve():
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # repo root
+from eulerlib import pisano
+from eulerlib.modcomb import prod_mod
+
+
+def solve(N=1000000):
     """
     Computes the value of P(1,000,000) mod 1,234,567,891 from first principles.
     """
-    N = 1000000
     MOD = 1234567891
 
     # =========================================================================
-    # Step 1: Pre-computation (SPF Sieve and Pisano Periods)
+    # Step 1: Pisano periods of every prime power q^k <= N
     # =========================================================================
 
-    # SPF Sieve for fast factorization
-    spf = list(range(N + 2))
-    for i in range(2, int((N + 1) ** 0.5) + 1):
-        if spf[i] == i:
-            for j in range(i * i, N + 2, i):
-                if spf[j] == j:
-                    spf[j] = i
-
-    def get_prime_factors(n):
-        factors = {}
-        while n > 1:
-            p = spf[n]
-            count = 0
-            while n % p == 0:
-                n //= p
-                count += 1
-            factors[p] = count
-        return factors
-
-    # Matrix multiplication for Fibonacci numbers
-    def mat_mul(A, B, m):
-        C = [[0, 0], [0, 0]]
-        for i in range(2):
-            for j in range(2):
-                for k in range(2):
-                    C[i][j] = (C[i][j] + A[i][k] * B[k][j]) % m
-        return C
-
-    # Matrix power for fast exponentiation
-    def mat_pow(A, n, m):
-        res = [[1, 0], [0, 1]]
-        base = A
-        while n > 0:
-            if n % 2 == 1:
-                res = mat_mul(res, base, m)
-            base = mat_mul(base, base, m)
-            n //= 2
-        return res
-
-    # F_n mod m
-    def fib_mod(n, m):
-        if n == 0:
-            return 0
-        F = [[1, 1], [1, 0]]
-        res = mat_pow(F, n - 1, m)
-        return res[0][0]
-
-    memo_k = {}
-
-    def get_entry_point(p):
-        if p in memo_k:
-            return memo_k[p]
-        if p == 2: return 3
-        if p == 3: return 4
-        if p == 5: return 5
-
-        if pow(5, (p - 1) // 2, p) == 1:
-            n = p - 1
-        else:
-            n = p + 1
-
-        factors = get_prime_factors(n)
-        d = n
-        for f in factors:
-            while d % f == 0 and fib_mod(d // f, p) == 0:
-                d //= f
-        memo_k[p] = d
-        return d
-
-    memo_pi = {}
-
-    def get_pi_prime(p):
-        if p in memo_pi: return memo_pi[p]
-        k = get_entry_point(p)
-        if p == 2: return 3
-        if p == 3: return 8
-        if p == 5: return 20
-
-        # Find order of F_{k+1} mod p
-        g = fib_mod(k + 1, p)
-        order = 0
-        if g == 1:
-            order = 1
-        elif g == p - 1:
-            order = 2
-        else:  # known property that order must be 4
-            order = 4
-
-        res = k * order
-        memo_pi[p] = res
-        return res
-
-    all_pisano_powers = []
-    primes = [i for i, p in enumerate(spf) if i > 1 and p == i]
-
-    for q in primes:
-        if q > N: continue
-
-        # Get pi(q)
-        try:
-            pi_q = get_pi_prime(q)
-        except Exception:
-            continue
+    # pi(n) for all n <= N at once (shared vectorized sieve), with its SPF table
+    _, pi, spf = pisano.tables(N)
+    n = np.arange(N + 1, dtype=np.int64)
+    is_pp = spf.prime_power_parts()[:N + 1] == n
+    is_pp[:2] = False
 
-        qk = q
-        d = pi_q
-
-        if d <= N:
-            all_pisano_powers.append((d, qk))
-
-        # Extend to powers q^k
-        if q == 2:  # pi(2^k) = 3 * 2^(k-1)
-            d, qk = 3, 2
-            while True:
-                qk *= 2
-                d *= 2
-                if d > N: break
-                all_pisano_powers.append((d, qk))
-        elif q == 3:  # pi(3^k) = 8 * 3^(k-1)
-            d, qk = 8, 3
-            while True:
-                qk *= 3
-                d *= 3
-                if d > N: break
-                all_pisano_powers.append((d, qk))
-        else:  # pi(q^k) = pi(q) * q^(k-1)
-            while True:
-                if N // q < qk: break
-                qk *= q
-                if N // q < d: break
-                d *= q
-                if d > N: break
-                all_pisano_powers.append((d, qk))
+    # (d, q^k) with d = pi(q^k) <= N, and the base prime q of each
+    qk = n[is_pp & (pi <= N)]
+    d_all = pi[qk]
+    q_all = spf.table[qk].astype(np.int64)
 
     # =========================================================================
     # Step 2: Sieve for M_tentative
     # =========================================================================
-    m_tentative = [1] * (N + 1)
-
-    # Organize powers by prime base
-    powers_by_q = defaultdict(list)
-    for d, qk in all_pisano_powers:
-        powers_by_q[spf[qk]].append((d, qk))
-
-    for q in powers_by_q:
-        powers_by_q[q].sort()
-
-        # Add (1,1) as the base case for the ratio calculation
-        seq = [(1, 1)] + powers_by_q[q]
-
-        inv_cache = {}
-        for i in range(1, len(seq)):
-            d_curr, qk_curr = seq[i]
-            d_prev, qk_prev = seq[i - 1]
-
-            if qk_prev not in inv_cache:
-                inv_cache[qk_prev] = pow(qk_prev, MOD - 2, MOD)
-
-            ratio = (qk_curr * inv_cache[qk_prev]) % MOD
-
-            for p in range(d_curr, N + 1, d_curr):
-                m_tentative[p] = (m_tentative[p] * ratio) % MOD
+    # Sorted by d, the periods of q, q^2, ... each divide the next, so the
+    # ratio q^k / q^(k-1) applied to the multiples of pi(q^k) is just q.
+    m_tentative = np.ones(N + 1, dtype=np.int64)
+    for d, q in zip(d_all.tolist(), q_all.tolist()):
+        m_tentative[d::d] = m_tentative[d::d] * q % MOD
 
     # =========================================================================
     # Step 3: Sieve for Validity (L(p) == p check)
     # =========================================================================
-    min_period = defaultdict(lambda: defaultdict(lambda: N + 1))
-    for d, qk in all_pisano_powers:
-        d_factors = get_prime_factors(d)
-        for r, b in d_factors.items():
-            for a in range(1, b + 1):
-                min_period[r][a] = min(min_period[r][a], d)
-
-    is_valid = [True] * (N + 1)
-    is_valid[1] = True  # p=1 is valid, M(1)=1
-
-    for r in primes:
-        if r > N: break
-        r_power = r
-        a = 1
-        while r_power <= N:
-            d_min = min_period[r][a]
-
-            # These are p values where v_r(p) == a
-            # A p fails if p is a multiple of r^a, not r^{a+1}, and p is not a multiple of d_min
-            r_power_next = r_power * r
-
-            if d_min > N:  # No period provides this factor, all are invalid
-                for p in range(r_power, N + 1, r_power):
-                    is_valid[p] = False
-                break
-
-            # We can sieve out invalid numbers
-            # p must be a multiple of lcm(r_power, d_min)
-            # A number is invalid if it's a multiple of r_power but not of lcm(r_power, d_min)
-            # This is complex to sieve directly. A simpler loop is fast enough.
-            for p in range(r_power, N + 1, r_power):
-                if p % r_power_next != 0:  # v_r(p) == a
-                    if p % d_min != 0:
-                        is_valid[p] = False
-
-            if r > N // r_power: break
-            r_power = r_power_next
-            a += 1
+    # min_period[r^a] = the least period d with r^a | d
+    min_period = np.full(N + 1, N + 1, dtype=np.int64)
+    for index, r, b in spf.factor_passes(d_all):
+        for a in range(1, int(b.max()) + 1):
+            sel = b >= a
+            np.minimum.at(min_period, r[sel] ** a, d_all[index[sel]])
+
+    # p is valid iff, for every prime power r^a exactly dividing p, some period
+    # provides r^a (min_period <= N) and p is a multiple of the least one.
+    is_valid = np.ones(N + 1, dtype=np.bool_)
+    for index, r, a in spf.factor_passes(n):
+        d_min = min_period[r ** a]
+        is_valid[index] &= (d_min <= N) & (n[index] % d_min == 0)
 
     # =========================================================================
     # Step 4: Final Calculation
     # =========================================================================
-    total_prod = 1
-    for p in range(1, N + 1):
-        if is_valid[p]:
-            total_prod = (total_prod * m_tentative[p]) % MOD
-
-    print(f"The final answer is {total_prod}.")
-
+    return prod_mod(m_tentative[1:][is_valid[1:]], MOD)
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(f"The final answer is {solve(*map(int, sys.argv[1:]))}.")
\ No newline at end of file
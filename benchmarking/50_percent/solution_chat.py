@@ -1,102 +1,29 @@
-# Python 3.13+; standard library only
+# Python 3.13+; standard library plus the shared sieve and factorization in eulerlib
 # Computes sum_{k=1..18} Q(10^k) mod 409120391
 
-import math, random
+import math, os, sys
 from functools import lru_cache
 
-MOD = 409120391
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # repo root
+from eulerlib import sieve
+from eulerlib.factor import divisors, factorize
 
-# ---------- Miller-Rabin (deterministic for 64-bit) ----------
-def is_probable_prime(n: int) -> bool:
-    if n < 2:
-        return False
-    small = [2,3,5,7,11,13,17,19,23,29,31,37]
-    for p in small:
-        if n % p == 0:
-            return n == p
-    # n-1 = d * 2^s
-    d = n - 1
-    s = 0
-    while d % 2 == 0:
-        d //= 2
-        s += 1
-    # bases suffice for n < 2^64
-    for a in [2,3,5,7,11,13,17]:
-        if a % n == 0:
-            continue
-        x = pow(a, d, n)
-        if x == 1 or x == n-1:
-            continue
-        for _ in range(s-1):
-            x = (x * x) % n
-            if x == n-1:
-                break
-        else:
-            return False
-    return True
-
-# ---------- Pollard Rho factoring ----------
-def _pollard_rho(n: int) -> int:
-    if n % 2 == 0: return 2
-    if n % 3 == 0: return 3
-    if n % 5 == 0: return 5
-    while True:
-        c = random.randrange(1, n-1)
-        f = lambda x: (pow(x, 2, n) + c) % n
-        x = random.randrange(2, n-1)
-        y = x
-        d = 1
-        while d == 1:
-            x = f(x)
-            y = f(f(y))
-            d = math.gcd(abs(x - y), n)
-        if d != n:
-            return d
-
-def _factor(n: int, out: dict):
-    if n == 1:
-        return
-    if is_probable_prime(n):
-        out[n] = out.get(n, 0) + 1
-        return
-    d = _pollard_rho(n)
-    _factor(d, out)
-    _factor(n // d, out)
-
-def factorize(n: int) -> dict:
-    res = {}
-    _factor(n, res)
-    return res
-
-def divisors_from_factors(f: dict) -> list[int]:
-    divs = [1]
-    for p, e in f.items():
-        cur = []
-        pe = 1
-        for _ in range(e+1):
-            for d in divs:
-                cur.append(d * pe)
-            pe *= p
-        divs = cur
-    return divs
+MOD = 409120391
 
 # ---------- small primes by sieve; split by mod 4 ----------
 def primes_upto(n: int) -> list[int]:
-    sieve = bytearray(b'\x01') * (n+1)
-    sieve[0:2] = b'\x00\x00'
-    for p in range(2, int(n**0.5)+1):
-        if sieve[p]:
-            step = p
-            start = p*p
-            sieve[start:n+1:step] = b'\x00' * (((n - start)//step) + 1)
-    return [i for i in range(2, n+1) if sieve[i]]
-
-_primes = primes_upto(10000)  # plenty for our exponent counts
-P1 = [p for p in _primes if p % 4 == 1]  # 5, 13, 17, ...
-P3 = [p for p in _primes if p % 4 == 3]  # 3, 7, 11, ...
-
-LOG_P1 = [math.log(p) for p in P1]
-LOG_P3 = [math.log(p) for p in P3]
+    return sieve.primes_upto(n).tolist()
+
+@lru_cache(maxsize=None)
+def prime_tables() -> tuple[list[int], list[int], list[float], list[float]]:
+    """(P1, P3, LOG_P1, LOG_P3), sieved on first use rather than at import."""
+    _primes = primes_upto(10000)  # plenty for our exponent counts
+    P1 = [p for p in _primes if p % 4 == 1]  # 5, 13, 17, ...
+    P3 = [p for p in _primes if p % 4 == 3]  # 3, 7, 11, ...
+    LOG_P1 = [math.log(p) for p in P1]
+    LOG_P3 = [math.log(p) for p in P3]
+    return P1, P3, LOG_P1, LOG_P3
+
 LOG2 = math.log(2.0)
 
 # ---------- caches ----------
@@ -105,8 +32,7 @@ def divisors_cached(n: int) -> list[int]:
     """All divisors of n (sorted)."""
     if n in div_cache:
         return div_cache[n]
-    f = factorize(n)
-    divs = sorted(divisors_from_factors(f))
+    divs = divisors(factorize(n))
     div_cache[n] = divs
     return divs
 
@@ -119,6 +45,7 @@ def _min_value_from_X(X: int, which: int) -> tuple[float, tuple[int, ...]]:
     """
     if X == 1:
         return (0.0, ())
+    _, _, LOG_P1, LOG_P3 = prime_tables()
     logs = LOG_P1 if which == 1 else LOG_P3
     divs = divisors_cached(X)
     idx_of = {d: i for i, d in enumerate(divs)}
@@ -152,7 +79,6 @@ def min_value_from_X(X: int, which: int) -> tuple[float, tuple[int, ...]]:
 
 # ---------- core: Q(10^k) ----------
 def Q_pow10(k: int) -> int:
-    random.seed(0xC0FFEE + k)  # stabilize Pollard-Rho randomness
     R = 10**k + 1             # odd
     # Enumerate odd divisors D of R (since V = R / D, MU+1 = 2D)
     divs_R = divisors_cached(R)
@@ -183,6 +109,7 @@ def Q_pow10(k: int) -> int:
                 best_a, best_ev, best_eu = a, ev, eu
 
     # Reconstruct N modulo MOD from exponents
+    P1, P3, _, _ = prime_tables()
     ans = pow(2, best_a, MOD)
     for i, alpha in enumerate(best_ev):
         ans = (ans * pow(P1[i], alpha, MOD)) % MOD
@@ -190,11 +117,17 @@ def Q_pow10(k: int) -> int:
         ans = (ans * pow(P3[i], beta, MOD)) % MOD
     return ans
 
-def main():
+def solve(K: int = 18) -> int:
+    # Start from cold caches so repeated calls each do the full work
+    div_cache.clear()
+    _min_value_from_X.cache_clear()
     total = 0
-    for k in range(1, 19):
+    for k in range(1, K + 1):
         total = (total + Q_pow10(k)) % MOD
-    print(total)
+    return total
+
+def main(K: int = 18):
+    print(solve(K))
 
 if __name__ == "__main__":
-    main()
+    main(*map(int, sys.argv[1:]))
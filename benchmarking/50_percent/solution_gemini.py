@@ -1,91 +1,27 @@
+import os
 import sys
 import math
-import random
-from collections import defaultdict
 from functools import lru_cache
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # repo root
+from eulerlib.factor import factorize
+
 # Set a higher recursion limit for deep searches.
 sys.setrecursionlimit(2000)
 
 MOD = 409120391
 
 
-# --- Miller-Rabin Primality Test ---
-def power(a, b, m):
-    res = 1
-    a %= m
-    while b > 0:
-        if b % 2 == 1:
-            res = (res * a) % m
-        a = (a * a) % m
-        b //= 2
-    return res
-
-
-def is_prime(n, k=5):
-    if n < 2: return False
-    if n == 2 or n == 3: return True
-    if n % 2 == 0 or n % 3 == 0: return False
-    d, s = n - 1, 0
-    while d % 2 == 0:
-        d //= 2
-        s += 1
-    for _ in range(k):
-        a = random.randint(2, n - 2)
-        x = power(a, d, n)
-        if x == 1 or x == n - 1:
-            continue
-        for _ in range(s - 1):
-            x = (x * x) % n
-            if x == n - 1:
-                break
-        else:
-            return False
-    return True
-
-
-# --- Pollard's Rho Integer Factorization ---
-def pollard_rho(n):
-    if is_prime(n): return n
-    if n % 2 == 0: return 2
-    x = random.randint(1, n - 2)
-    y = x
-    c = random.randint(1, n - 1)
-    d = 1
-    while d == 1:
-        x = ((x * x) % n + c + n) % n
-        y = ((y * y) % n + c + n) % n
-        y = ((y * y) % n + c + n) % n
-        d = math.gcd(abs(x - y), n)
-        if d == n:
-            return pollard_rho(n)
-    return d
-
-
+# --- Factorization (shared engine: trial division, Brent's rho, BPSW) ---
 @lru_cache(maxsize=None)
 def get_factors(n):
-    if n == 1: return {}
-    factors = defaultdict(int)
-    num = n
-    while num > 1:
-        if is_prime(num):
-            factors[num] += 1
-            break
-        factor = pollard_rho(num)
-        sub_factors1 = get_factors(factor)
-        for p, e in sub_factors1.items(): factors[p] += e
-        sub_factors2 = get_factors(num // factor)
-        for p, e in sub_factors2.items(): factors[p] += e
-        break
-    return dict(factors)
+    return factorize(n)
 
 
 # --- Primes pre-computation ---
-P1_PRIMES = []
-P3_PRIMES = []
-
-
 def sieve_primes(limit):
+    P1_PRIMES = []
+    P3_PRIMES = []
     is_p = [True] * (limit + 1)
     is_p[0] = is_p[1] = False
     for p in range(2, limit + 1):
@@ -97,11 +33,14 @@ def sieve_primes(limit):
                     P3_PRIMES.append(p)
             for i in range(p * p, limit + 1, p):
                 is_p[i] = False
+    return P1_PRIMES, P3_PRIMES
 
 
-sieve_primes(500)  # Increased slightly to be safe
-P1_PRIMES_TUPLE = tuple(P1_PRIMES)
-P3_PRIMES_TUPLE = tuple(P3_PRIMES)
+@lru_cache(maxsize=None)
+def prime_tuples():
+    """(P1_PRIMES_TUPLE, P3_PRIMES_TUPLE), sieved on first use rather than at import."""
+    P1_PRIMES, P3_PRIMES = sieve_primes(500)  # Increased slightly to be safe
+    return tuple(P1_PRIMES), tuple(P3_PRIMES)
 
 
 # --- Optimized `min_num_creator` ---
@@ -152,6 +91,7 @@ def get_divisors_from_factors(factors_dict):
 
 # --- Main solver function ---
 def find_q(N):
+    P1_PRIMES_TUPLE, P3_PRIMES_TUPLE = prime_tuples()
     target = 2 * N + 2
     min_overall_n = float('inf')
 
@@ -204,17 +144,27 @@ def get_all_divisors(n):
     return get_divisors_from_factors(factors)
 
 
-def main():
+def solve(K=18):
+    # Start from cold caches so repeated calls each do the full work
+    get_factors.cache_clear()
+    min_num_creator_optimized.cache_clear()
+    get_all_divisors.cache_clear()
+
     total_sum = 0
-    for k_exp in range(1, 19):
+    for k_exp in range(1, K + 1):
         N = 10 ** k_exp
         Q_N = find_q(N)
         total_sum = (total_sum + Q_N) % MOD
+    return total_sum
+
+
+def main(K=18):
+    total_sum = solve(K)
 
     print("The final answer is:")
     print(total_sum)
 
 
 if __name__ == "__main__":
-    main()
+    main(*map(int, sys.argv[1:]))
 
@@ -1,4 +1,6 @@
 import math
+import sys
+from decimal import Decimal, localcontext
 
 def P_black(R, B):
     # If R is odd, parity prevents reaching all-black
@@ -11,5 +13,152 @@ def P_black(R, B):
                 - math.lgamma(x + B + 0.5) - math.lgamma(x))
     return 1.0 - math.exp(ln_ratio)
 
-ans = P_black(24690, 12345)
-print(f"{ans:.10f}")
+# lnG(z + 1/2) - lnG(z) = (1/2) ln z + sum_n c_n z^-n for large z (Stirling), with
+# c_n = (2^-n - 2) B_(n+1) / (n (n+1)) for odd n, B_k the Bernoulli numbers.
+# After shifting z up to 16 the first omitted term, 929569/15728640 z^-15, is below 1e-19.
+HALF_SHIFT_SERIES = ((1, -1 / 8), (3, 1 / 192), (5, -1 / 640), (7, 17 / 14336),
+                     (9, -31 / 18432), (11, 691 / 180224), (13, -5461 / 425984))
+HALF_SHIFT_MIN = 16
+
+def P_black_grid(R_array, B_array):
+    """
+    P_black over broadcast arrays of R and B, returned as a float64 array.
+
+    Same closed form, with ln_ratio = g(x) - g(x+B) where g(z) = lnG(z+1/2) - lnG(z).
+    g is evaluated for whole arrays: small z are moved up with
+    g(z) = g(z+1) - ln(1 + 1/(2z)), then the two asymptotic series are
+    subtracted term by term, so the leading (1/2) ln z terms cancel exactly into
+    -(1/2) log1p(B/x). 1 - exp(ln_ratio) is taken as -expm1(ln_ratio), which
+    keeps full relative precision when the ratio is close to 1 (B << R).
+    """
+    import numpy as np
+
+    R, B = np.broadcast_arrays(np.asarray(R_array, dtype=np.int64),
+                               np.asarray(B_array, dtype=np.int64))
+    shape = R.shape
+    R = R.ravel()
+    x = (R // 2).astype(np.float64)
+    y = x + B.ravel()
+    ln_ratio = np.zeros(x.size)
+    # move small x and y up to HALF_SHIFT_MIN, collecting the g(z) - g(z+1) terms
+    for z, sign in ((x, -1.0), (y, 1.0)):
+        small = np.flatnonzero((0 < z) & (z < HALF_SHIFT_MIN))  # x = 0 only for R < 2, masked below
+        while small.size:
+            ln_ratio[small] += sign * np.log1p(0.5 / z[small])
+            z[small] += 1
+            small = small[z[small] < HALF_SHIFT_MIN]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ln_ratio -= 0.5 * np.log1p((y - x) / x)
+        # the two series by Horner in 1/z^2
+        for z, sign in ((x, 1.0), (y, -1.0)):
+            t = 1.0 / (z * z)
+            acc = np.full(x.size, HALF_SHIFT_SERIES[-1][1])
+            for _, c in HALF_SHIFT_SERIES[-2::-1]:
+                acc = acc * t + c
+            ln_ratio += sign * acc / z
+
+    # R odd: parity prevents reaching all-black; R = 0: black has already won;
+    # B = 0: red has already won (the series would leave ~1e-16 of residue here)
+    B = B.ravel()
+    P = np.where(R % 2 == 1, 0.0,
+                 np.where(R == 0, 1.0, np.where(B == 0, 0.0, -np.expm1(ln_ratio))))
+    return np.clip(P, 0.0, 1.0).reshape(shape)
+
+# Bernoulli numbers B_2, B_4, ..., B_32 for the Stirling series
+#   lnG(w) = (w - 1/2) ln w - w + ln(2 pi)/2 + sum_k B_2k / (2k (2k-1) w^(2k-1)) + R_K(w),
+# whose remainder after K terms satisfies |R_K(w)| <= |B_(2K+2)| / ((2K+2)(2K+1) w^(2K+1))
+# for real w > 0.
+STIRLING_BERNOULLI = ((1, 6), (-1, 30), (1, 42), (-1, 30), (5, 66), (-691, 2730), (7, 6),
+                      (-3617, 510), (43867, 798), (-174611, 330), (854513, 138),
+                      (-236364091, 2730), (8553103, 6), (-23749461029, 870),
+                      (8615841276005, 14322), (-7709321041217, 510))
+DOUBLE_EPS = 2.0 ** -53
+
+def _ln_ratio(x, y, ln1p, terms, shift_min):
+    """
+    ln_ratio = g(x) - g(y) with g(z) = lnG(z+1/2) - lnG(z), in the number type of x and y.
+
+    Small z are moved up to shift_min with g(z) = g(z+1) - ln1p(1/(2z)); then
+    g(z) = z ln1p(1/(2z)) + (ln z)/2 - 1/2 + S(z+1/2) - S(z), with S the first
+    `terms` Stirling terms. Returns (ln_ratio, sum of the absolute values of
+    the summands, number of summands, truncation bound).
+    """
+    total, size, count = 0, 0.0, 0
+
+    def add(v):
+        nonlocal total, size, count
+        total += v
+        size += abs(float(v))
+        count += 1
+
+    ends = []
+    for z, sign in ((x, 1), (y, -1)):
+        while z < shift_min:
+            add(-sign * ln1p(1 / (2 * z)))
+            z += 1
+        ends.append(z)
+    x, y = ends
+    add(x * ln1p(1 / (2 * x)))
+    add(-y * ln1p(1 / (2 * y)))
+    add(-ln1p((y - x) / x) / 2)
+    half = type(x)(1) / 2
+    truncation = 0.0
+    for w, sign in ((x + half, 1), (x, -1), (y + half, -1), (y, 1)):
+        for k, (num, den) in enumerate(STIRLING_BERNOULLI[:terms], 1):
+            add(sign * num * w ** (1 - 2 * k) / (den * 2 * k * (2 * k - 1)))
+        num, den = STIRLING_BERNOULLI[terms]
+        truncation += abs(num) / (den * (2 * terms + 2) * (2 * terms + 1)) * float(w) ** (-2 * terms - 1)
+    return total, size, count, truncation
+
+def P_black_precise(R, B, digits=10):
+    """
+    P(R, B) with a bound on its absolute error: returns (value, bound), value a Decimal.
+
+    Both paths evaluate the closed form through _ln_ratio, in which no
+    log-gamma value of size z ln z is ever formed, so nothing large cancels
+    even for R and B around 10^9. The double path is taken when its bound
+    (Stirling truncation, plus rounding of at most a few ulps per summand,
+    assuming libm's log1p and expm1 are within 1 ulp) is below 10^-(digits+1).
+    Otherwise the same sums are redone in `decimal` arithmetic, whose ln and
+    exp are correctly rounded, raising the shift point and the working
+    precision until the bound holds.
+    """
+    if R % 2 == 1:
+        return Decimal(0), 0.0
+    if R == 0 or B == 0:
+        return Decimal(int(R == 0)), 0.0
+    x = R // 2
+    goal = 10.0 ** -(digits + 1)
+
+    L, size, count, truncation = _ln_ratio(float(x), float(x + B), math.log1p,
+                                           len(STIRLING_BERNOULLI) - 1, 16)
+    bound = truncation + (count + 8) * 2 * DOUBLE_EPS * size + 2 * DOUBLE_EPS
+    if bound <= goal:
+        return Decimal(-math.expm1(L)), bound
+
+    shift_min = max(16, digits)
+    terms = len(STIRLING_BERNOULLI) - 1
+    prec = digits + len(str(x + B)) + 12
+    while True:
+        with localcontext() as ctx:
+            ctx.prec = prec
+            L, size, count, truncation = _ln_ratio(Decimal(x), Decimal(x + B),
+                                                   lambda t: (1 + t).ln(), terms, shift_min)
+            value = 1 - L.exp()
+        # each summand is within a few units of its last place, and the
+        # z ln1p(1/(2z)) terms inherit z times the rounding of 1 + 1/(2z)
+        ulp = 10.0 ** (1 - prec)
+        rounding = (count + 8) * ulp * (size + 2 * (x + B) + shift_min) + ulp
+        if truncation + rounding <= goal:
+            return value, truncation + rounding
+        if truncation > rounding:
+            shift_min *= 2
+        else:
+            prec += 10
+
+def solve(R=24690, B=12345):
+    return float(P_black_precise(R, B)[0])
+
+if __name__ == "__main__":
+    ans = solve(*map(int, sys.argv[1:]))
+    print(f"{ans:.10f}")
@@ -1,55 +1,51 @@
+import sys
+from array import array
+
+
+def compute_P_row(R, B):
+    """
+    The whole final row P(R, 0), ..., P(R, B) as an array('d') of length B + 1.
+
+    P(r, b) = ((r-1) * P(r-2, b) + 2*b * P(r, b-1)) / (r + 2*b - 1) only looks
+    back two reds, and odd r can never reach all-black (P(1, b) = 0 makes the
+    whole odd chain 0). So only even r are visited, and only the previous and
+    the current row are kept: 2 * (B + 1) doubles, about 200 KB at the target,
+    instead of a dict entry per (r, b).
+    """
+    if R % 2 == 1:
+        return array('d', bytes(8 * (B + 1)))
+
+    # Row r = 0: P(0, 0) = 0 and P(0, b) = 1 for b > 0
+    prev = array('d', [1.0]) * (B + 1)
+    prev[0] = 0.0
+    cur = array('d', bytes(8 * (B + 1)))  # cur[0] = P(r, 0) = 0 for every r > 0
+
+    for r in range(2, R + 1, 2):
+        p_r_b1 = 0.0  # P(r, b-1), carried along the row
+        for b in range(1, B + 1):
+            p_r_b1 = ((r - 1) * prev[b] + 2 * b * p_r_b1) / (r + 2 * b - 1)
+            cur[b] = p_r_b1
+        prev, cur = cur, prev
+
+    return prev
+
+
 def compute_P(R, B):
-    # Create a 2D DP table
-    # dp[r][b] will store P(r, b)
-    # We only need even values of r when b is fixed, plus r=0,1
-
-    # Initialize with base cases
-    dp = {}
-
-    # Base cases: P(0, b) = 1 for b > 0
-    for b in range(B + 1):
-        if b > 0:
-            dp[(0, b)] = 1.0
-        else:
-            dp[(0, 0)] = 0.0
-
-    # Base cases: P(r, 0) = 0 for r > 0
-    for r in range(R + 1):
-        if r > 0:
-            dp[(r, 0)] = 0.0
-
-    # Base cases: P(1, b) = 0 for b >= 1
-    for b in range(1, B + 1):
-        dp[(1, b)] = 0.0
-
-    # Fill the DP table column by column (increasing b)
-    for b in range(1, B + 1):
-        # For each b, compute P(r, b) for r = 2, 3, ..., R
-        for r in range(2, R + 1):
-            if (r, b) not in dp:
-                # Use the recurrence relation
-                # P(r,b) = ((r-1) * P(r-2,b) + 2*b * P(r,b-1)) / (r + 2*b - 1)
-
-                # Get P(r-2, b)
-                if r >= 2:
-                    p_r2_b = dp.get((r - 2, b), 0.0)
-                else:
-                    p_r2_b = 0.0
-
-                # Get P(r, b-1)
-                p_r_b1 = dp.get((r, b - 1), 0.0)
-
-                # Calculate P(r, b)
-                dp[(r, b)] = ((r - 1) * p_r2_b + 2 * b * p_r_b1) / (r + 2 * b - 1)
-
-    return dp[(R, B)]
-
-
-# Verify with given examples
-print(f"P(2,2) = {compute_P(2, 2):.10f}")
-print(f"P(10,9) = {compute_P(10, 9):.10f}")
-print(f"P(34,25) = {compute_P(34, 25):.10f}")
-
-# Compute the answer
-answer = compute_P(24690, 12345)
-print(f"\nP(24690,12345) = {answer:.10f}")
\ No newline at end of file
+    return compute_P_row(R, B)[B]
+
+
+def solve(R=24690, B=12345):
+    return compute_P(R, B)
+
+
+if __name__ == "__main__":
+    # Verify with given examples
+    print(f"P(2,2) = {compute_P(2, 2):.10f}")
+    print(f"P(10,9) = {compute_P(10, 9):.10f}")
+    print(f"P(34,25) = {compute_P(34, 25):.10f}")
+
+    # Compute the answer
+    R = int(sys.argv[1]) if len(sys.argv) > 1 else 24690
+    B = int(sys.argv[2]) if len(sys.argv) > 2 else 12345
+    answer = solve(R, B)
+    print(f"\nP({R},{B}) = {answer:.10f}")
\ No newline at end of file
@@ -1,7 +1,12 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 
-def solve():
+MIN_SEGMENT = 200_000  # cells per thread before splitting a diagonal beats dispatching it
+
+
+def solve_rows(R=24690, B=12345):
     """
     Solves Project Euler Problem 579 using dynamic programming.
 
@@ -22,9 +27,6 @@ def solve():
     We compute this using DP, optimizing memory by only storing the previous
     and current rows for the 'i' dimension.
     """
-    R = 24690
-    B = 12345
-
     I = R // 2
 
     # dp corresponds to the row for i-1 (previous)
@@ -55,10 +57,76 @@ def solve():
 
     # After the loop, dp holds the final row of probabilities for i=I
     final_probability = dp[B]
+    return final_probability
+
+
+def _diagonal_segment(prev, cur, two_i_minus_1, d, lo, hi):
+    """dp on anti-diagonal d for lo <= i < hi, from diagonal d-1 in prev (both indexed by i)."""
+    i = np.arange(lo, hi)
+    numerator = two_i_minus_1[lo:hi] * prev[lo - 1:hi - 1] + (2 * (d - i)) * prev[lo:hi]
+    np.divide(numerator, 2 * d - 1, out=cur[lo:hi])
 
-    print(f"The value of P({R},{B}) is: {final_probability:.10f}")
+
+def solve_wavefront(R=24690, B=12345, threads=1):
+    """
+    The same DP swept by anti-diagonals d = i + j instead of by rows.
+
+    dp[i][j] needs dp[i-1][j] and dp[i][j-1], which both lie on diagonal d-1,
+    and its denominator 2i+2j-1 = 2d-1 is the same along the diagonal. So a whole
+    diagonal is one vectorized update from the previous one, and the results
+    are bit-for-bit those of the row loop (the same products and sums in the
+    same order). Diagonals are stored indexed by i, two of them at a time.
+
+    With threads > 1, a diagonal of at least threads * MIN_SEGMENT cells is
+    cut into that many segments computed in a thread pool; NumPy releases the
+    GIL inside the array operations. Shorter diagonals run inline, since the
+    pool round trip per diagonal costs more than it saves. At the target size
+    no diagonal is longer than about 12k cells, so threads do not pay there.
+    """
+    I = R // 2
+    if B == 0:
+        return 0.0
+    if I == 0:
+        return 1.0
+
+    two_i_minus_1 = 2.0 * np.arange(I + 1) - 1
+    prev = np.zeros(I + 1)  # diagonal d = 0 holds dp[0][0] = 0
+    cur = np.zeros(I + 1)
+    pool = ThreadPoolExecutor(threads) if threads > 1 else None
+    try:
+        for d in range(1, I + B + 1):
+            # interior cells 1 <= i <= I, 1 <= j = d - i <= B
+            lo, hi = max(1, d - B), min(I, d - 1) + 1
+            if pool is None or hi - lo < threads * MIN_SEGMENT:
+                if lo < hi:
+                    _diagonal_segment(prev, cur, two_i_minus_1, d, lo, hi)
+            else:
+                cuts = [lo + (hi - lo) * k // threads for k in range(threads + 1)]
+                list(pool.map(_diagonal_segment, [prev] * threads, [cur] * threads,
+                              [two_i_minus_1] * threads, [d] * threads, cuts[:-1], cuts[1:]))
+            if d <= B:
+                cur[0] = 1.0  # dp[0][d] = 1
+            if d <= I:
+                cur[d] = 0.0  # dp[d][0] = 0
+            prev, cur = cur, prev
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    # The last diagonal d = I + B holds only dp[I][B]
+    return float(prev[I])
+
+
+def solve(R=24690, B=12345, mode="wavefront", threads=1):
+    """P(R, B) by the DP of `solve_rows`, swept by rows or (default) by anti-diagonals."""
+    if mode == "rows":
+        return solve_rows(R, B)
+    return solve_wavefront(R, B, threads)
 
 
 if __name__ == "__main__":
-    solve()
+    R = int(sys.argv[1]) if len(sys.argv) > 1 else 24690
+    B = int(sys.argv[2]) if len(sys.argv) > 2 else 12345
+    threads = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    print(f"The value of P({R},{B}) is: {solve(R, B, threads=threads):.10f}")
 
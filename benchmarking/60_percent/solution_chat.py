@@ -8,35 +8,28 @@
 #       F(n)=F(n-1)+F(n-2)+F(n-3)+(3/4)F(n-4)+(1/10)F(n-5), F(0)=1.
 #   - G(n)=n! * F(n) mod MOD.
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # repo root
+from eulerlib.linrec import nth_term
+from eulerlib.modcomb import factorial_mod
+
 MOD = 1_000_000_007
 
-def solve(N: int) -> int:
+def solve(N: int = 10_000_000) -> int:
     inv4 = pow(4, MOD - 2, MOD)
     inv10 = pow(10, MOD - 2, MOD)
     a4 = (3 * inv4) % MOD       # 3/4 mod MOD
     a5 = inv10                  # 1/10 mod MOD
 
-    # Rolling values for F(n-5),...,F(n-1). Base: F(0)=1, earlier = 0.
-    Fm5 = 0
-    Fm4 = 0
-    Fm3 = 0
-    Fm2 = 0
-    Fm1 = 1
-
-    fact = 1
-    F = 1  # current F(n)
-
-    for n in range(1, N + 1):
-        # F(n) = F(n-1)+F(n-2)+F(n-3)+(3/4)F(n-4)+(1/10)F(n-5)
-        F = (Fm1 + Fm2 + Fm3 + (a4 * Fm4 + a5 * Fm5) % MOD) % MOD
-        # Shift window
-        Fm5, Fm4, Fm3, Fm2, Fm1 = Fm4, Fm3, Fm2, Fm1, F
-        # Update n!
-        fact = (fact * n) % MOD
+    # F(n) = F(n-1)+F(n-2)+F(n-3)+(3/4)F(n-4)+(1/10)F(n-5), with F(0)=1 and
+    # F(-4..-1)=0. Index the sequence from F(-4) and jump to F(N) directly.
+    F = nth_term([1, 1, 1, a4, a5], [0, 0, 0, 0, 1], N + 4, MOD)
 
-    return (F * fact) % MOD
+    return (F * factorial_mod(N, MOD)) % MOD
 
 if __name__ == "__main__":
-    N = 10_000_000
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
     ans = solve(N)
     print(ans)
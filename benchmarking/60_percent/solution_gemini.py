@@ -1,12 +1,16 @@
+import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # repo root
+from eulerlib.linrec import nth_term
+from eulerlib.modcomb import factorial_mod
 
-def solve():
+
+def solve(N=10 ** 7):
     """
     Computes the number of beautiful graphs on 10^7 vertices, G(10^7),
     modulo 10^9 + 7.
     """
-    N = 10 ** 7
     MOD = 10 ** 9 + 7
 
     # T(s): number of 2-edge-colorings of K_s with no monochromatic K_3.
@@ -45,51 +49,16 @@ def solve():
     for i in range(1, 6):
         t[i] = (T_VALUES[i] * pow(fact[i], -1, MOD)) % MOD
 
-    # Transition matrix for the recurrence h(n) = t_1*h(n-1) + ... + t_5*h(n-5)
-    M = [
-        [t[1], t[2], t[3], t[4], t[5]],
-        [1, 0, 0, 0, 0],
-        [0, 1, 0, 0, 0],
-        [0, 0, 1, 0, 0],
-        [0, 0, 0, 1, 0],
-    ]
-
-    def mat_mul(A, B):
-        C = [[0] * 5 for _ in range(5)]
-        for i in range(5):
-            for j in range(5):
-                for k in range(5):
-                    C[i][j] = (C[i][j] + A[i][k] * B[k][j]) % MOD
-        return C
-
-    def mat_pow(A, exp):
-        res = [[int(i == j) for j in range(5)] for i in range(5)]
-        base = A
-        while exp > 0:
-            if exp % 2 == 1:
-                res = mat_mul(res, base)
-            base = mat_mul(base, base)
-            exp //= 2
-        return res
-
-    power = N - 5
-    M_pow = mat_pow(M, power)
-
-    # The state vector is S_k = [h(k), h(k-1), ..., h(k-4)]^T
-    # We compute S_N = M_pow * S_5
-    S5 = [h[5], h[4], h[3], h[2], h[1]]
-
-    h_n = 0
-    for i in range(5):
-        h_n = (h_n + M_pow[0][i] * S5[i]) % MOD
+    # h(n) = t_1*h(n-1) + ... + t_5*h(n-5) for n >= 6, started from h(1)..h(5):
+    # jump straight to h(N) by polynomial remainder instead of a 5x5 matrix power.
+    h_n = nth_term(t[1:6], h[1:6], N - 1, MOD)
 
     # Calculate N! mod MOD for the final step G(N) = h(N) * N!
-    fact_n = fact[5]
-    for i in range(6, N + 1):
-        fact_n = (fact_n * i) % MOD
+    fact_n = factorial_mod(N, MOD)
 
     result = (h_n * fact_n) % MOD
-    print(result)
+    return result
 
 
-solve()
\ No newline at end of file
+if __name__ == "__main__":
+    print(solve(*map(int, sys.argv[1:])))
\ No newline at end of file
@@ -5,6 +5,7 @@
 # Final fast solver: works for huge k,t and r=62.
 # Standard library only.
 
+import sys
 from math import comb
 
 MOD = 1_000_062_031
@@ -62,6 +63,10 @@ def fast_F_mod(k: int, t: int, r: int, MOD: int = MOD) -> int:
     return (term1 + term2) % MOD
 
 
+def solve(r: int = 62, k: int = 10**18 + 31, t: int = 10**14 + 31) -> int:
+    return fast_F_mod(k, t, r, MOD)
+
+
 # ---------- sanity tests (small) ----------
 def brute_F_small(k: int, t: int, r: int, MOD: int = None) -> int:
     """O(k) reference for small k, to validate formulas."""
@@ -84,8 +89,6 @@ if __name__ == "__main__":
     assert fast_F_mod(103, 13, 6, MOD) == 878_922_518
 
     # Final query:
-    k = 10**18 + 31
-    t = 10**14 + 31
-    r = 62
-    ans = fast_F_mod(k, t, r, MOD)
+    r = int(sys.argv[1]) if len(sys.argv) > 1 else 62
+    ans = solve(r)
     print(ans)  # <-- prints the final answer modulo 1_000_062_031
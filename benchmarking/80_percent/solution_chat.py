@@ -1,53 +1,15 @@
 # Computes S(100) for the "absolute neighbour differences on a circle" problem
 # using the Rule-90 / finite-field approach described above.
-# Standard library only.
+# Standard library plus the shared prime sieve and SPF table in eulerlib.
 
 import math
+import os
+import sys
 from functools import reduce
 
-# ---------- basic number theory ----------
-
-def phi(n):
-    res = n
-    p = 2
-    t = n
-    while p * p <= t:
-        if t % p == 0:
-            while t % p == 0:
-                t //= p
-            res -= res // p
-        p += 1
-    if t > 1:
-        res -= res // t
-    return res
-
-def prime_factors_small(n):
-    """factor n into primes (n <= ~1e7 here), returns dict p->exp (used for small d)"""
-    res = {}
-    p = 2
-    t = n
-    while p * p <= t:
-        if t % p == 0:
-            cnt = 0
-            while t % p == 0:
-                t //= p
-                cnt += 1
-            res[p] = cnt
-        p += 1
-    if t > 1:
-        res[t] = 1
-    return res
-
-def multiplicative_order_mod(a, n):
-    """ord_n(a) for gcd(a,n)=1"""
-    if math.gcd(a, n) != 1:
-        return 0
-    ph = phi(n)
-    o = ph
-    for p in list(prime_factors_small(ph).keys()):
-        while o % p == 0 and pow(a, o // p, n) == 1:
-            o //= p
-    return o
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # repo root
+from eulerlib.sieve import primes_upto
+from eulerlib.spf import SPF
 
 # ---------- bit-polynomial over GF(2) ----------
 
@@ -199,14 +161,7 @@ def gf_pow(a, e, f):
 # ---------- factor 2^{m'} - 1 by trial division (m' <= 41 here) ----------
 
 def sieve(n):
-    s = bytearray(b"\x01") * (n + 1)
-    s[0:2] = b"\x00\x00"
-    for p in range(2, int(n**0.5) + 1):
-        if s[p]:
-            step = p
-            start = p * p
-            s[start:n + 1:step] = b"\x00" * (((n - start) // step) + 1)
-    return [i for i, b in enumerate(s) if b]
+    return primes_upto(n).tolist()
 
 def factor_integer(N, primes):
     res = {}
@@ -226,9 +181,9 @@ def factor_integer(N, primes):
 
 # ---------- compute orders of beta = alpha^t + alpha^{-t} for each odd d ----------
 
-def beta_orders_for_d(d, fmods_by_m, N_fact_cache, primes):
-    # m = ord_d(2)
-    m = multiplicative_order_mod(2, d)
+def beta_orders_for_d(d, fmods_by_m, N_fact_cache, primes, spf, ord2):
+    # m = ord_d(2), from the table of orders
+    m = ord2[d]
     if m == 0:
         return {1}
     if (m % 2) == 0 and pow(2, m // 2, d) == d - 1:
@@ -248,7 +203,7 @@ def beta_orders_for_d(d, fmods_by_m, N_fact_cache, primes):
 
     # find an element alpha of exact order d: alpha = g^{(2^m - 1)/d} then adjust
     alpha = None
-    d_primes = list(prime_factors_small(d).keys())
+    d_primes = list(spf.factorize(d))
     for seed in range(1, min(512, (1 << m))):
         a = gf_pow(seed, proj, f)
         if gf_pow(a, d, f) != 1:
@@ -297,10 +252,12 @@ def lcm_closure(values):
 
 def compute_periods_up_to(N):
     # precompute unique m and m' values to size the sieve for factoring 2^{m'}-1
+    spf = SPF(N)
+    ord2 = spf.order_of_2().tolist()  # ord_d(2) for every odd d <= N
     m_values = set()
     mprime_values = set()
     for d in range(3, N + 1, 2):
-        m = multiplicative_order_mod(2, d)
+        m = ord2[d]
         if m == 0:
             continue
         m_values.add(m)
@@ -319,7 +276,7 @@ def compute_periods_up_to(N):
     # orders for each odd d
     Ods = {}
     for d in range(3, N + 1, 2):
-        Ods[d] = beta_orders_for_d(d, fmods_by_m, N_fact_cache, primes)
+        Ods[d] = beta_orders_for_d(d, fmods_by_m, N_fact_cache, primes, spf, ord2)
 
     # build P(n) and union over n
     union = set()
@@ -349,6 +306,9 @@ def compute_periods_up_to(N):
         union |= periods
     return union
 
+def solve(N=100):
+    return sum(compute_periods_up_to(N))
+
 if __name__ == "__main__":
     # small checks
     U6 = compute_periods_up_to(6)
@@ -356,6 +316,6 @@ if __name__ == "__main__":
     U30 = compute_periods_up_to(30)
     assert sum(U30) == 20381  # given in problem
 
-    U100 = compute_periods_up_to(100)
-    ans = sum(U100)
-    print(f"S(100) = {ans}")
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    ans = solve(N)
+    print(f"S({N}) = {ans}")
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import sys
 from itertools import permutations
 
 # ---------- core permutation ops ----------
@@ -48,6 +49,10 @@ def Q_bruteforce(n):
             total += rank[perm_pow(p, i)]
     return total
 
+def solve(n=6):
+    return Q_bruteforce(n)
+
 if __name__ == "__main__":
-    for n in [2, 3, 4, 5, 6]:
-        print(f"Q({n}) =", Q_bruteforce(n))
+    n_max = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    for n in range(2, n_max + 1):
+        print(f"Q({n}) =", solve(n))
@@ -0,0 +1,20 @@
+"""
+Shared number-theory building blocks for the solution scripts.
+
+The solutions were written independently, and each one carried its own copy of
+the usual machinery: prime sieves, factorization, modular tables. The common
+pieces live here once, tuned, so a solution can import them instead:
+
+    sieve        segmented odd-only prime sieve: primes_upto, iter_primes, prime_pi
+    factor       trial division, Brent's Pollard rho, BPSW; factorize, divisors
+    spf          smallest-prime-factor table: bulk factorization, phi, ord_d(2)
+    modcomb      factorials, inverse factorials and inverses mod p, growable tables
+    linrec       linear recurrences: n-th term by polynomial remainder, Berlekamp-Massey
+    fibonacci    F_n, F_(n+1), L_n mod m by fast doubling, scalar or batched
+    pisano       entry points and Pisano periods for all moduli up to N
+    multinomial  sums of powers of multinomial coefficients over all compositions
+
+The array-producing modules need NumPy. Solution scripts add the repository
+root to `sys.path` before importing this package, so that they still run as
+plain `python path/to/solution_x.py`.
+"""
@@ -0,0 +1,256 @@
+"""
+Integer factorization: trial division, Brent's Pollard rho and deterministic
+primality testing, with results remembered on disk.
+
+    is_prime(n)        deterministic Miller-Rabin below 2^64, BPSW above
+    factorize(n)       {prime: exponent}, primes in increasing order
+    divisors(n)        sorted list of all divisors
+    pollard_brent(n)   a non-trivial factor of an odd composite n
+
+`factorize` first divides out the primes below TRIAL_LIMIT, from a table
+sieved once (standard library only, so importing this module stays cheap). It
+splits what is left with Brent's variant of Pollard rho, which batches BATCH
+differences into one product per gcd. The rho seeds are fixed, so every run
+does the same work and gets the same answer.
+
+Factorizations of numbers with a cofactor left after trial division are kept
+in an SQLite file (`cache_path()`, shared by concurrent processes), so a
+script that factors the same large numbers on every run, such as 10**k + 1 for
+k = 1..18, only pays for them once. Set EULERLIB_CACHE_DIR to move the file,
+or EULERLIB_NO_CACHE=1 to turn it off.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from functools import lru_cache
+from math import gcd, isqrt
+from pathlib import Path
+
+TRIAL_LIMIT = 1 << 16
+BATCH = 128  # rho steps per gcd
+
+# Bases that make Miller-Rabin exact for n < 2^64 (Jim Sinclair).
+_MR_BASES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+
+
+@lru_cache(maxsize=None)
+def _trial_primes() -> tuple[int, ...]:
+    # A bytearray sieve: the table is small, and this keeps the module free of NumPy.
+    is_p = bytearray([1]) * TRIAL_LIMIT
+    is_p[0] = is_p[1] = 0
+    for p in range(2, isqrt(TRIAL_LIMIT - 1) + 1):
+        if is_p[p]:
+            is_p[p * p::p] = bytes(len(range(p * p, TRIAL_LIMIT, p)))
+    return tuple(i for i, flag in enumerate(is_p) if flag)
+
+
+def _strong_probable_prime(n: int, a: int) -> bool:
+    """Miller-Rabin round for odd n > 2 with base a."""
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def _jacobi(a: int, n: int) -> int:
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _strong_lucas_probable_prime(n: int) -> bool:
+    """Strong Lucas test with Selfridge's parameters (method A); n odd, not a square."""
+    d = 5
+    while True:
+        j = _jacobi(d, n)
+        if j == -1:
+            break
+        if j == 0 and abs(d) != n:
+            return False
+        d = -d - 2 if d > 0 else -d + 2
+    p, q = 1, (1 - d) // 4
+
+    k, s = n + 1, 0
+    while k % 2 == 0:
+        k //= 2
+        s += 1
+
+    # U_k, V_k, Q^k by the binary method over the bits of k
+    u, v, qk = 0, 2, 1
+    inv2 = (n + 1) // 2
+    for bit in bin(k)[2:]:
+        u, v = u * v % n, (v * v - 2 * qk) % n
+        qk = qk * qk % n
+        if bit == "1":
+            u, v = (p * u + v) * inv2 % n, (d * u + p * v) * inv2 % n
+            qk = qk * q % n
+    if u == 0 or v == 0:
+        return True
+    for _ in range(s - 1):
+        v = (v * v - 2 * qk) % n
+        qk = qk * qk % n
+        if v == 0:
+            return True
+    return False
+
+
+def is_prime(n: int) -> bool:
+    """Exact below 2^64; above that, the Baillie-PSW test (no known counterexample)."""
+    if n < 2:
+        return False
+    for p in _trial_primes()[:25]:  # primes below 100
+        if n % p == 0:
+            return n == p
+    if n < 10_000:
+        return True
+    if n < 1 << 64:
+        return all(_strong_probable_prime(n, a % n) for a in _MR_BASES_64 if a % n)
+    if not _strong_probable_prime(n, 2):
+        return False
+    r = isqrt(n)
+    return r * r != n and _strong_lucas_probable_prime(n)
+
+
+def pollard_brent(n: int, c: int = 1) -> int:
+    """A non-trivial factor of the odd composite `n` (Brent's cycle finding, batched gcds)."""
+    while True:
+        y, r, q, g = 2, 1, 1, 1
+        x = ys = y
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(BATCH, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += BATCH
+            r *= 2
+        if g == n:  # the batch overshot: redo its steps one gcd at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = gcd(abs(x - ys), n)
+        if g != n:
+            return g
+        c += 1  # this polynomial cycled without splitting n; try the next
+
+
+def _split(n: int, out: dict[int, int]) -> None:
+    """Add the prime factorization of n (free of small factors) to `out`."""
+    stack = [n]
+    while stack:
+        m = stack.pop()
+        if m == 1:
+            continue
+        if is_prime(m):
+            out[m] = out.get(m, 0) + 1
+            continue
+        r = isqrt(m)
+        if r * r == m:
+            stack += [r, r]
+            continue
+        d = pollard_brent(m)
+        stack += [d, m // d]
+
+
+class FactorCache:
+    """Persistent n -> factorization map in SQLite; keys are decimal strings."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._db: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, timeout=30)
+            self._db.execute("CREATE TABLE IF NOT EXISTS factors (n TEXT PRIMARY KEY, f TEXT)")
+        return self._db
+
+    def get(self, n: int) -> dict[int, int] | None:
+        row = self._connect().execute("SELECT f FROM factors WHERE n = ?", (str(n),)).fetchone()
+        return None if row is None else {int(p): e for p, e in json.loads(row[0])}
+
+    def put(self, n: int, factors: dict[int, int]) -> None:
+        with self._connect() as db:
+            db.execute("INSERT OR REPLACE INTO factors VALUES (?, ?)",
+                       (str(n), json.dumps([[str(p), e] for p, e in factors.items()])))
+
+
+def cache_path() -> Path:
+    base = os.environ.get("EULERLIB_CACHE_DIR") or Path.home() / ".cache" / "eulerlib"
+    return Path(base) / "factors.sqlite"
+
+
+@lru_cache(maxsize=None)
+def _disk_cache() -> FactorCache | None:
+    if os.environ.get("EULERLIB_NO_CACHE"):
+        return None
+    return FactorCache(cache_path())
+
+
+def factorize(n: int) -> dict[int, int]:
+    """Prime factorization of n >= 1 as {prime: exponent}, in increasing order of prime."""
+    if n < 1:
+        raise ValueError(f"factorize needs a positive integer, got {n}")
+    out: dict[int, int] = {}
+    m = n
+    for p in _trial_primes():
+        if p * p > m:
+            break
+        if m % p == 0:
+            e = 0
+            while m % p == 0:
+                m //= p
+                e += 1
+            out[p] = e
+    if m == 1:
+        return out
+    if m < TRIAL_LIMIT * TRIAL_LIMIT:  # no prime factor below sqrt(m) remained
+        out[m] = out.get(m, 0) + 1
+        return out
+
+    cache = _disk_cache()
+    rest = cache.get(m) if cache is not None else None
+    if rest is None:
+        rest = {}
+        _split(m, rest)
+        rest = dict(sorted(rest.items()))
+        if cache is not None:
+            cache.put(m, rest)
+    for p, e in rest.items():
+        out[p] = out.get(p, 0) + e
+    return dict(sorted(out.items()))
+
+
+def divisors(n: int | dict[int, int]) -> list[int]:
+    """Sorted divisors of n, or of the number with factorization `n`."""
+    factors = factorize(n) if isinstance(n, int) else n
+    divs = [1]
+    for p, e in factors.items():
+        divs = [d * p ** i for d in divs for i in range(e + 1)]
+    return sorted(divs)
@@ -0,0 +1,172 @@
+"""
+Linear recurrences a_i = c_1 a_(i-1) + ... + c_k a_(i-k): jump to any index,
+evaluate many indices at once, and find a recurrence from a prefix.
+
+    nth_term(coeffs, init, n, mod)         a_n over Z/mod, from a_0..a_(k-1) = init
+    nth_terms(coeffs, init, ns, mod)       [a_n for n in ns], sharing the squarings
+    nth_term_gf2x(coeffs, init, n)         a_n when coefficients and terms are
+                                           polynomials over GF(2), packed into ints
+    berlekamp_massey(seq, p)               shortest coeffs generating seq over GF(p)
+    clmul(a, b)                            carry-less product, i.e. product in GF(2)[x]
+
+The jump is Fiduccia's method (Kitamasa): a_n = sum r_i a_i where
+r(t) = t^n mod (t^k - c_1 t^(k-1) - ... - c_k), computed by square-and-multiply
+on polynomials of degree < k. That is O(k^2 log n) ring operations with
+schoolbook products; for the orders in this repository (k <= 5) it beats
+FFT multiplication by a wide margin, and beats k x k matrix powers by a
+factor of about k.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Sequence
+
+Op = Callable[[int, int], int]
+PolyOp = Callable[[list[int], list[int]], list[int]]  # product mod the characteristic polynomial
+
+
+def clmul(a: int, b: int) -> int:
+    """Carry-less product of a and b: multiplication of bit-packed GF(2)[x] polynomials."""
+    if a.bit_length() < b.bit_length():
+        a, b = b, a
+    res = 0
+    while b:
+        low = b & -b
+        res ^= a * low  # shift a by the position of b's lowest set bit
+        b ^= low
+    return res
+
+
+def _mulmod(a: list[int], b: list[int], coeffs: Sequence[int], add: Op, mul: Op,
+            zero: int) -> list[int]:
+    """a(t) * b(t) reduced by t^k = c_1 t^(k-1) + ... + c_k, for degree < k inputs."""
+    k = len(coeffs)
+    prod = [zero] * (2 * k - 1)
+    for i, x in enumerate(a):
+        if x == zero:
+            continue
+        for j, y in enumerate(b):
+            prod[i + j] = add(prod[i + j], mul(x, y))
+    for d in range(2 * k - 2, k - 1, -1):
+        top = prod[d]
+        if top == zero:
+            continue
+        for j, c in enumerate(coeffs, 1):
+            prod[d - j] = add(prod[d - j], mul(top, c))
+    return prod[:k]
+
+
+def _mulmod_int(a: list[int], b: list[int], coeffs: Sequence[int], mod: int) -> list[int]:
+    """`_mulmod` over Z/mod with inline arithmetic, reducing once per coefficient."""
+    k = len(coeffs)
+    prod = [0] * (2 * k - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                prod[i + j] += x * y
+    for d in range(2 * k - 2, k - 1, -1):
+        top = prod[d] % mod
+        if top:
+            for j, c in enumerate(coeffs, 1):
+                prod[d - j] += top * c
+    return [x % mod for x in prod[:k]]
+
+
+def _ladder(coeffs: Sequence[int], max_n: int, mulmod: PolyOp, zero: int,
+            one: int) -> list[list[int]]:
+    """t^(2^i) mod the characteristic polynomial, for 2^i <= max_n, squaring with `mulmod`."""
+    k = len(coeffs)
+    t = [zero] * k
+    if k == 1:
+        t[0] = coeffs[0]  # t = c_1 modulo t - c_1
+    else:
+        t[1] = one
+    powers = [t]
+    for _ in range(1, max(max_n, 1).bit_length()):
+        powers.append(mulmod(powers[-1], powers[-1]))
+    return powers
+
+
+def _apply(coeffs: Sequence[int], init: Sequence[int], n: int, ladder: list[list[int]],
+           add: Op, mul: Op, zero: int, one: int) -> int:
+    k = len(coeffs)
+    if n < k:
+        return init[n]
+    r = [zero] * k
+    r[0] = one
+    for i in range(n.bit_length()):
+        if n >> i & 1:
+            r = _mulmod(r, ladder[i], coeffs, add, mul, zero)
+    total = zero
+    for x, a in zip(r, init):
+        total = add(total, mul(x, a))
+    return total
+
+
+def _check(coeffs: Sequence[int], init: Sequence[int]) -> None:
+    if not coeffs or len(init) != len(coeffs):
+        raise ValueError(f"need k >= 1 coefficients and k initial terms, got "
+                         f"{len(coeffs)} and {len(init)}")
+
+
+def nth_terms(coeffs: Sequence[int], init: Sequence[int], ns: Sequence[int],
+              mod: int) -> list[int]:
+    """a_n mod `mod` for every n in `ns`; the powers t^(2^i) are computed once for all."""
+    _check(coeffs, init)
+    if not ns:
+        return []
+    k = len(coeffs)
+    coeffs = [c % mod for c in coeffs]
+    init = [a % mod for a in init]
+    ladder = _ladder(coeffs, max(ns), lambda a, b: _mulmod_int(a, b, coeffs, mod), 0, 1)
+
+    out = []
+    for n in ns:
+        if n < k:
+            out.append(init[n])
+            continue
+        r = ladder[n.bit_length() - 1]
+        for i in range(n.bit_length() - 1):
+            if n >> i & 1:
+                r = _mulmod_int(r, ladder[i], coeffs, mod)
+        out.append(sum(x * a for x, a in zip(r, init)) % mod)
+    return out
+
+
+def nth_term(coeffs: Sequence[int], init: Sequence[int], n: int, mod: int) -> int:
+    """a_n mod `mod`, where a_i = sum_j coeffs[j-1] * a_(i-j) and a_0..a_(k-1) = init."""
+    return nth_terms(coeffs, init, [n], mod)[0]
+
+
+def nth_term_gf2x(coeffs: Sequence[int], init: Sequence[int], n: int) -> int:
+    """a_n over GF(2)[x]: addition is XOR and multiplication is `clmul`."""
+    _check(coeffs, init)
+    add = int.__xor__
+    ladder = _ladder(coeffs, n, lambda a, b: _mulmod(a, b, coeffs, add, clmul, 0), 0, 1)
+    return _apply(coeffs, init, n, ladder, add, clmul, 0, 1)
+
+
+def berlekamp_massey(seq: Sequence[int], p: int) -> list[int]:
+    """
+    Shortest coeffs (c_1..c_L) with seq[i] = sum c_j seq[i-j] mod the prime p, for all i >= L.
+
+    2L terms of the sequence determine a recurrence of order L.
+    """
+    seq = [x % p for x in seq]
+    n = len(seq)
+    conn = [1] + [0] * n  # connection polynomial C: sum_j C[j] seq[i-j] = 0
+    prev = [1] + [0] * n  # C before the last change of length
+    length, shift, prev_delta = 0, 0, 1
+    for i in range(n):
+        shift += 1
+        delta = sum(conn[j] * seq[i - j] for j in range(length + 1)) % p
+        if delta == 0:
+            continue
+        old = conn[:]
+        scale = delta * pow(prev_delta, -1, p) % p
+        for j in range(shift, n + 1):
+            conn[j] = (conn[j] - scale * prev[j - shift]) % p
+        if 2 * length > i:
+            continue
+        length, prev, prev_delta, shift = i + 1 - length, old, delta, 0
+    return [-c % p for c in conn[1:length + 1]]
@@ -0,0 +1,173 @@
+"""
+Factorials, inverse factorials and inverses modulo a prime, as NumPy tables.
+
+    factorial_mod(n, mod)     n! mod `mod`, without keeping a table
+    prod_mod(values, mod)     product of an array of residues mod `mod`
+    t = tables(mod)           one shared ModTables per modulus in this process
+    t.ensure(n)               make t.fact, t.inv_fact and t.inv cover 0..n
+    t.binom(n, k)             n choose k mod `mod`, growing the tables if needed
+
+A running product mod p is sequential, so the tables are filled in a
+transposed layout: the range is cut into about sqrt(n) chunks, and row j holds
+the j-th element of every chunk. One vectorized multiply per row runs all the
+chunk scans side by side, and a second pass applies the carry from the chunks
+before. Products of two residues must fit in int64, hence mod < 2^31, which
+covers 10^9 + 7 and 998244353. Inverses need a prime modulus larger than n.
+
+Tables grow on demand, at least doubling each time. With `persist=True` they
+are also saved as .npy files under EULERLIB_CACHE_DIR (default
+~/.cache/eulerlib) and memory-mapped on the next run. A 10^7-entry table is
+then built once and shared by every later process.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from math import isqrt
+from pathlib import Path
+
+import numpy as np
+
+MAX_MOD = 1 << 31
+KINDS = ("fact", "inv_fact", "inv")
+
+
+def _check_mod(mod: int) -> None:
+    if not 2 <= mod < MAX_MOD:
+        raise ValueError(f"modulus must be in [2, 2^31), got {mod}")
+
+
+def _cumprod_mod(values: np.ndarray, mod: int) -> np.ndarray:
+    """Running products of `values` (int64 residues) modulo `mod`."""
+    n = values.size
+    if n == 0:
+        return values.copy()
+    width = isqrt(n) or 1  # elements per chunk
+    chunks = -(-n // width)
+    a = np.ones(chunks * width, dtype=np.int64)
+    a[:n] = values
+    a = np.ascontiguousarray(a.reshape(chunks, width).T)  # a[j] = j-th element of each chunk
+    for j in range(1, width):
+        np.remainder(a[j] * a[j - 1], mod, out=a[j])
+    carries = [1] * chunks
+    for i, total in enumerate(a[-1].tolist()[:-1]):
+        carries[i + 1] = carries[i] * total % mod
+    a = a * np.array(carries, dtype=np.int64) % mod
+    return a.T.reshape(-1)[:n]
+
+
+def prod_mod(values, mod: int) -> int:
+    """Product of an array of residues modulo `mod`, by pairwise products."""
+    _check_mod(mod)
+    a = np.asarray(values, dtype=np.int64) % mod
+    if a.size == 0:
+        return 1 % mod
+    while a.size > 1:
+        if a.size % 2:
+            a = np.append(a, 1)
+        a = a[0::2] * a[1::2] % mod
+    return int(a[0])
+
+
+def factorial_mod(n: int, mod: int, chunk: int = 1 << 20) -> int:
+    """n! mod `mod`, as products over blocks of `chunk` factors."""
+    _check_mod(mod)
+    if n >= mod:
+        return 0
+    result = 1
+    for lo in range(1, n + 1, chunk):
+        result = result * prod_mod(np.arange(lo, min(lo + chunk, n + 1), dtype=np.int64), mod) % mod
+    return result
+
+
+def cache_dir() -> Path:
+    base = os.environ.get("EULERLIB_CACHE_DIR") or Path.home() / ".cache" / "eulerlib"
+    return Path(base) / "modcomb"
+
+
+class ModTables:
+    """Growable fact / inv_fact / inv tables modulo the prime `mod`; see the module docstring."""
+
+    def __init__(self, mod: int, persist: bool = False):
+        _check_mod(mod)
+        self.mod = mod
+        self.persist = persist and not os.environ.get("EULERLIB_NO_CACHE")
+        one = np.ones(1, dtype=np.int64)
+        self.fact, self.inv_fact, self.inv = one, one.copy(), np.zeros(1, dtype=np.int64)
+        if self.persist:
+            self._load()
+
+    def __len__(self) -> int:
+        return self.fact.size
+
+    def _path(self, kind: str) -> Path:
+        return cache_dir() / str(self.mod) / f"{kind}.npy"
+
+    def _load(self) -> None:
+        try:
+            arrays = [np.load(self._path(kind), mmap_mode="r") for kind in KINDS]
+        except (OSError, ValueError):
+            return
+        size = min(a.size for a in arrays)  # files written by racing processes may differ
+        if size > self.fact.size:
+            self.fact, self.inv_fact, self.inv = (a[:size] for a in arrays)
+
+    def _save(self) -> None:
+        for kind in KINDS:
+            path = self._path(kind)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+            np.save(tmp, getattr(self, kind))
+            os.replace(tmp, path)
+
+    def ensure(self, n: int) -> "ModTables":
+        """Grow the tables to cover 0..n (n < mod). Returns self."""
+        if n < self.fact.size:
+            return self
+        if n >= self.mod:
+            raise ValueError(f"{n}! is 0 modulo {self.mod}; the tables need n < mod")
+        if self.persist:
+            self._load()
+            if n < self.fact.size:
+                return self
+        mod, start = self.mod, self.fact.size
+        end = min(max(n + 1, 2 * start), self.mod)  # new size
+
+        ks = np.arange(start, end, dtype=np.int64)
+        fact = _cumprod_mod(ks, mod) * int(self.fact[-1]) % mod
+        # inv_fact[k] = inv_fact[end - 1] * (k + 1) * ... * (end - 1), a running product from the top
+        top = pow(int(fact[-1]), -1, mod)
+        inv_fact = _cumprod_mod(np.concatenate(([top], ks[:0:-1])), mod)[::-1]
+        # inv[k] = (k - 1)! / k!
+        prev = np.concatenate(([self.fact[-1]], fact[:-1]))
+        inv = inv_fact * prev % mod
+
+        self.fact = np.concatenate((self.fact, fact))
+        self.inv_fact = np.concatenate((self.inv_fact, inv_fact))
+        self.inv = np.concatenate((self.inv, inv))
+        if self.persist:
+            self._save()
+        return self
+
+    def factorial(self, n: int) -> int:
+        return int(self.ensure(n).fact[n])
+
+    def inv_factorial(self, n: int) -> int:
+        return int(self.ensure(n).inv_fact[n])
+
+    def inverse(self, n: int) -> int:
+        return int(self.ensure(n).inv[n])
+
+    def binom(self, n: int, k: int) -> int:
+        if not 0 <= k <= n:
+            return 0
+        self.ensure(n)
+        mod = self.mod
+        return int(self.fact[n]) * int(self.inv_fact[k]) % mod * int(self.inv_fact[n - k]) % mod
+
+
+@lru_cache(maxsize=None)
+def tables(mod: int, persist: bool = False) -> ModTables:
+    """The ModTables for `mod` shared by everything in this process."""
+    return ModTables(mod, persist)
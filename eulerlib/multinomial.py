@@ -0,0 +1,40 @@
+"""
+Sums of powers of multinomial coefficients over all compositions.
+
+    multinomial_power_sums(parts, n, r=2, mod=None)
+        [g_0, ..., g_n] with g_s = sum of multinomial(s; c_1, ..., c_parts)^r
+        over all c_1 + ... + c_parts = s, c_i >= 0
+
+Such sums count arrangements summed over every multiset at once, e.g. the sum
+of P^2 over the digit multisets of k-digit numbers, without enumerating the
+C(n + parts - 1, parts - 1) multisets.
+
+g_s / (s!)^r is the coefficient of x^s in A(x)^parts, A(x) = sum_j x^j / (j!)^r.
+J. C. P. Miller's recurrence for powers of a series, n b_n = sum_j
+((parts + 1) j - n) a_j b_(n-j), becomes, after scaling by (n!)^r,
+
+    n g_n = sum_(j=1..n) ((parts + 1) j - n) C(n, j)^r g_(n-j),
+
+one O(n^2) pass instead of repeated series multiplication. With `mod` (a prime
+above n) the same pass runs over Z/mod.
+"""
+
+from __future__ import annotations
+
+
+def multinomial_power_sums(parts: int, n: int, r: int = 2, mod: int | None = None) -> list[int]:
+    """g_0..g_n as exact ints, or reduced mod the prime `mod` (which must exceed n)."""
+    if parts < 1 or n < 0 or r < 1:
+        raise ValueError(f"need parts >= 1, n >= 0 and r >= 1, got {parts}, {n}, {r}")
+    if mod is not None and mod <= n:
+        raise ValueError(f"mod must be a prime above n = {n}, got {mod}")
+    g = [1 if mod is None else 1 % mod]
+    row = [1]  # C(0, 0)
+    for m in range(1, n + 1):
+        # Pascal's rule: row[j] = C(m, j) for j = 0..m
+        row = [1] + [a + b for a, b in zip(row, row[1:])] + [1]
+        acc = 0
+        for j in range(1, m + 1):
+            acc += ((parts + 1) * j - m) * row[j] ** r * g[m - j]
+        g.append(acc // m if mod is None else acc % mod * pow(m, -1, mod) % mod)
+    return g
@@ -0,0 +1,204 @@
+"""
+Smallest-prime-factor table for every integer up to n, with bulk queries.
+
+The table is one uint32 NumPy array (4 bytes per number, against about 36 for
+a list of Python ints), filled by one masked slice assignment per prime up to
+sqrt(n). Single lookups go through a memoryview of the same buffer, which
+hands back plain Python ints without the cost of NumPy scalar indexing.
+
+    t = SPF(n)
+    t[k]                    smallest prime factor of k (t[1] == 1)
+    t.primes()              int64 array of the primes <= n
+    t.factorize(k)          {prime: exponent}, primes in increasing order
+    t.factor_arrays(ks)     (index, prime, exponent) arrays for many numbers at once
+    t.factor_passes(ks)     the same, one distinct prime per number per pass
+    t.divisors(k)           sorted divisors of k
+    t.phi_range(lo, hi)     Euler's phi for lo <= k < hi, as an int64 array
+    t.order_of_2()          ord_d(2) for every odd d <= n, at index d
+    t.fill_lcm(r)           extend r from the prime powers by lcm, in place
+
+phi_range and fill_lcm fill [lo, 2*lo) from values below lo (k = spf(k) *
+(k // spf(k))), so the whole range takes about log2(n) vectorized steps.
+order_of_2 still needs a Python loop over the primes, for ord_p(2) itself.
+"""
+
+from __future__ import annotations
+
+from math import isqrt
+from typing import Iterator
+
+import numpy as np
+
+from eulerlib.sieve import primes_upto
+
+
+def spf_table(n: int) -> np.ndarray:
+    """uint32 array s of length n + 1 with s[k] the smallest prime factor of k, s[0] = 0, s[1] = 1."""
+    if n >= 1 << 32:
+        raise ValueError(f"SPF table limited to n < 2^32, got {n}")
+    s = np.zeros(n + 1, dtype=np.uint32)
+    s[2::2] = 2
+    for p in primes_upto(isqrt(n))[1:].tolist():
+        odd_multiples = s[p * p::2 * p]  # a view; multiples below p*p have a smaller factor
+        odd_multiples[odd_multiples == 0] = p
+    unset = np.flatnonzero(s == 0)
+    s[unset] = unset  # primes, and 0 and 1
+    return s
+
+
+class SPF:
+    """Smallest-prime-factor table for 0..n; see the module docstring."""
+
+    def __init__(self, n: int):
+        self.n = n
+        self.table = spf_table(n)
+        self._lookup = memoryview(self.table)
+        self._pp: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return self.n + 1
+
+    def __getitem__(self, k: int) -> int:
+        return self._lookup[k]
+
+    def primes(self) -> np.ndarray:
+        k = np.arange(2, self.n + 1, dtype=np.int64)
+        return k[self.table[2:] == k]
+
+    def factorize(self, k: int) -> dict[int, int]:
+        """Prime factorization of 1 <= k <= n as {prime: exponent}."""
+        lookup = self._lookup
+        out: dict[int, int] = {}
+        while k > 1:
+            p = lookup[k]
+            e = 0
+            while k % p == 0:
+                k //= p
+                e += 1
+            out[p] = e
+        return out
+
+    def factor_passes(self, ks) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Peel the smallest remaining prime off every k in `ks`, one pass at a time.
+
+        Each pass yields int64 arrays (index, prime, exponent) in which every
+        index occurs at most once, so they can drive plain fancy-index updates.
+        """
+        rest = np.asarray(ks, dtype=np.int64).copy()
+        active = np.flatnonzero(rest > 1)
+        while active.size:
+            m = rest[active]
+            p = self.table[m].astype(np.int64)
+            e = np.zeros(active.size, dtype=np.int64)
+            again = np.arange(active.size)
+            while again.size:
+                m[again] //= p[again]
+                e[again] += 1
+                again = again[m[again] % p[again] == 0]
+            yield active, p, e
+            rest[active] = m
+            active = active[m > 1]
+
+    def factor_arrays(self, ks) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Factorize every k in `ks` at once.
+
+        Returns int64 arrays (index, prime, exponent): ks[index[j]] is divisible
+        by exactly prime[j] ** exponent[j]. Entries are grouped by pass, not by
+        number; `np.lexsort((prime, index))` puts them in the usual order.
+        """
+        parts = list(self.factor_passes(ks))
+        if not parts:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, empty
+        return tuple(np.concatenate(column) for column in zip(*parts))
+
+    def divisors(self, k: int) -> list[int]:
+        """Sorted divisors of 1 <= k <= n."""
+        divs = [1]
+        for p, e in self.factorize(k).items():
+            divs = [d * p ** i for d in divs for i in range(e + 1)]
+        return sorted(divs)
+
+    def _blocks(self, hi: int) -> Iterator[tuple[int, int, np.ndarray, np.ndarray]]:
+        """
+        Yield (lo, top, p, m) over [2, hi) in blocks [lo, 2*lo): p = spf(k), m = k // p.
+
+        Every m is below lo, so a recurrence in m can fill a whole block from
+        the blocks before it with one vectorized step.
+        """
+        lo = 2
+        while lo < hi:
+            top = min(2 * lo, hi)
+            p = self.table[lo:top].astype(np.int64)
+            yield lo, top, p, np.arange(lo, top, dtype=np.int64) // p
+            lo = top
+
+    def phi_range(self, lo: int, hi: int) -> np.ndarray:
+        """Euler's phi(k) for lo <= k < hi (with 1 <= lo and hi <= n + 1), as int64."""
+        phi = np.zeros(max(hi, 2), dtype=np.int64)
+        phi[1] = 1
+        for start, top, p, m in self._blocks(hi):
+            # phi(p*m) = phi(m) * p if p | m, else phi(m) * (p - 1)
+            phi[start:top] = phi[m] * np.where(self.table[m] == p, p, p - 1)
+        return phi[lo:hi]
+
+    def order_of_2(self) -> np.ndarray:
+        """
+        int64 array r of length n + 1 with r[d] = ord_d(2) for odd d (r[1] = 1), 0 for even d.
+
+        ord_p(2) divides p - 1, and is found by dividing out the prime factors
+        of p - 1 from the table. For prime powers ord_{p^k}(2) is ord_{p^(k-1)}(2)
+        or p times it, and for other d it is the lcm over the prime powers
+        exactly dividing d (`fill_lcm`).
+        """
+        n = self.n
+        r = np.zeros(n + 1, dtype=np.int64)
+        if n >= 1:
+            r[1] = 1
+        for p in self.primes()[1:].tolist():
+            o = p - 1
+            for q in self.factorize(p - 1):
+                while o % q == 0 and pow(2, o // q, p) == 1:
+                    o //= q
+            r[p] = o
+            pk = p * p
+            while pk <= n:
+                if pow(2, o, pk) != 1:
+                    o *= p
+                r[pk] = o
+                pk *= p
+        return self.fill_lcm(r, odd_only=True)
+
+    def prime_power_parts(self) -> np.ndarray:
+        """
+        int64 array pp with pp[k] the power of spf(k) exactly dividing k (pp[1] = 1).
+
+        k >= 2 is a prime power exactly when pp[k] == k.
+        """
+        if self._pp is None:
+            pp = np.zeros(self.n + 1, dtype=np.int64)
+            if self.n >= 1:
+                pp[1] = 1
+            for lo, top, p, m in self._blocks(self.n + 1):
+                pp[lo:top] = np.where(self.table[m] == p, pp[m] * p, p)
+            self._pp = pp
+        return self._pp
+
+    def fill_lcm(self, r: np.ndarray, odd_only: bool = False) -> np.ndarray:
+        """
+        Complete `r` in place from its values at the prime powers: r[k] becomes
+        the lcm of r over the prime powers exactly dividing k. Returns r, which
+        may be shorter than the table.
+
+        For an arithmetic function that is lcm-multiplicative, such as a
+        multiplicative order or a Pisano period. With `odd_only` the even
+        indices are left alone.
+        """
+        pp = self.prime_power_parts()
+        for lo, top, _, _ in self._blocks(min(r.size, self.n + 1)):
+            k = np.arange(lo | 1 if odd_only else lo, top, 2 if odd_only else 1, dtype=np.int64)
+            k = k[pp[k] != k]  # not a prime power; both parts are below lo
+            r[k] = np.lcm(r[pp[k]], r[k // pp[k]])
+        return r
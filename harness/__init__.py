@@ -0,0 +1,12 @@
+"""
+Benchmark harness for the LLM-generated Project Euler solutions.
+
+Finds every `solution_*.py` in the repository, runs each one in its own
+subprocess and records how long it took, how much memory it used and what it
+printed. Run `python -m harness --help` from the repository root for usage.
+"""
+
+from harness.discover import Solution, find_solutions
+from harness.runner import RunResult, run_solution
+
+__all__ = ["Solution", "find_solutions", "RunResult", "run_solution"]
@@ -0,0 +1,409 @@
+"""
+Command-line entry point: `python -m harness <command> [options]`.
+
+    python -m harness list
+    python -m harness run [--timeout 300] [--out DIR] [--profile] [--jobs J] [--repeat N]
+                          [--force] [--memory-limit MB] [--save-memory-baseline] [PATTERN ...]
+    python -m harness scale [--factor F] [--budget S] [PATTERN ...]
+    python -m harness bench [--size N] [--warmup W] [--repeat R] [PATTERN ...]
+    python -m harness diff [--repeat R] [--budget S] [PATTERN ...]
+    python -m harness check [PATTERN ...]
+    python -m harness simulate R B [--games N] [--workers W] [--seed S] [--confidence C]
+    python -m harness report [--readme]
+    python -m harness leaderboard [--kind runs|inprocess] [RESULTS_JSON]
+    python -m harness answers set GROUP ANSWER
+
+PATTERN is a glob on solution ids such as `5_percent/*` or `*/chat`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from harness import answers, cache, montecarlo, report
+from harness.cache import cache_key
+from harness.differential import SHARED_SIZES, compare_group
+from harness.discover import REPO_ROOT, find_solutions
+from harness.inprocess import call_quietly, load_module, time_solve
+from harness.memory import DEFAULT_TOLERANCE, load_baseline, memory_alarms, save_baseline
+from harness.results import (DEFAULT_OUT_DIR, DIFF_CSV_FIELDS, INPROCESS_CSV_FIELDS,
+                             SCALING_CSV_FIELDS, latest_results, load_runs, run_metadata, write_run)
+from harness.runner import DEFAULT_TIMEOUT
+from harness.scaling import startup_seconds, sweep
+from harness.scheduler import DEFAULT_MEMORY_KB, DEFAULT_SHORT_S, Job, run_jobs, summarize
+from harness.specs import spec_for
+
+
+def _fmt_row(r) -> str:
+    return (f"{r.id:<28} {r.status:<8} {r.wall_s:>9.2f}s {r.cpu_s:>9.2f}s "
+            f"{r.peak_rss_kb / 1024:>9.1f}MB  {r.verification}")
+
+
+def cmd_list(args) -> int:
+    for s in find_solutions(args.patterns):
+        print(f"{s.id:<28} {s.relpath}")
+    return 0
+
+
+def cmd_run(args) -> int:
+    solutions = find_solutions(args.patterns)
+    if not solutions:
+        print("no solutions match", file=sys.stderr)
+        return 1
+
+    repeat = 1 if args.profile else args.repeat
+    meta = run_metadata()
+    meta.update(timeout_s=args.timeout, profile=args.profile, jobs=args.jobs,
+                repeat=repeat, short_s=args.short, pinned=not args.no_pin, force=args.force,
+                memory_limit_mb=args.memory_limit)
+    registry = answers.load_registry()
+    previous = latest_results(args.out)
+
+    def verify(r):
+        return answers.verify(r["id"].split("/")[0], spec_for(r["id"]), r["params"],
+                              r["answer"], registry)
+
+    print(f"{'solution':<28} {'status':<8} {'wall':>10} {'cpu':>10} {'peak rss':>11}  verification")
+    jobs, cached, keys = [], {}, {}
+    for s in solutions:
+        spec = spec_for(s.id)
+        params = spec.target_params if spec else None
+        if not args.profile:
+            keys[s.id] = cache_key(s, params, args.memory_limit)
+            hit = None if args.force else cache.load(args.out, keys[s.id])
+            # A cached short result only counts if it was sampled often enough,
+            # and any result only if every sample would also beat this timeout.
+            if (hit and (hit.get("repeat", 1) >= repeat or hit["wall_s"] >= args.short)
+                    and max(hit.get("wall_samples_s") or [hit["wall_s"]]) <= args.timeout):
+                hit.update(cached=True, verification=verify(hit))
+                cached[s.id] = hit
+                print(f"{s.id:<28} {'cached':<8} {hit['wall_s']:>9.2f}s {hit['cpu_s']:>9.2f}s "
+                      f"{hit['peak_rss_kb'] / 1024:>9.1f}MB  {hit['verification']}", flush=True)
+                continue
+        last = previous.get(s.id, {})
+        jobs.append(Job(s, params=params, answer_re=spec.answer_re if spec else None,
+                        memory_kb=last.get("peak_rss_kb") or DEFAULT_MEMORY_KB,
+                        expected_s=last.get("wall_s")))
+
+    def on_sample(r):
+        r.verification = verify(r.to_dict())
+        print(_fmt_row(r), flush=True)
+
+    samples = run_jobs(jobs, workers=args.jobs, repeat=repeat, short_s=args.short,
+                       timeout=args.timeout, pin=not args.no_pin,
+                       profile_dir=args.out if args.profile else None,
+                       memory_limit_mb=args.memory_limit, on_sample=on_sample)
+    results = []
+    for s in solutions:
+        if s.id in cached:
+            results.append(cached[s.id])
+            continue
+        r = summarize(samples[s.id])
+        if s.id in keys:
+            cache.store(args.out, keys[s.id], r)
+        results.append(r)
+
+    if repeat > 1 or args.jobs > 1:
+        print(f"\n{'solution':<28} {'runs':>4} {'median':>10} {'iqr':>9}  verification")
+        for r in results:
+            print(f"{r['id']:<28} {r['repeat']:>4} {r['wall_s']:>9.3f}s {r['wall_iqr_s']:>8.3f}s"
+                  f"  {r['verification']}")
+
+    alarms = memory_alarms(results, load_baseline(args.out), tolerance=args.memory_tolerance)
+    meta["memory_alarms"] = [a.id for a in alarms]
+    if alarms:
+        print("\npeak memory above baseline:")
+        for a in alarms:
+            print(f"  {a}")
+
+    json_path, csv_path = write_run(results, meta, args.out)
+    print(f"\nwrote {json_path}\nwrote {csv_path}")
+    if args.profile:
+        print(f"hot-path reports in {Path(args.out) / 'profiles'}")
+    if args.save_memory_baseline:
+        print(f"wrote {save_baseline(results, args.out)}")
+    return 1 if alarms else 0
+
+
+def cmd_scale(args) -> int:
+    solutions = [s for s in find_solutions(args.patterns) if spec_for(s.id)]
+    if not solutions:
+        print("no solutions with a size spec match", file=sys.stderr)
+        return 1
+
+    startup = startup_seconds()
+    meta = run_metadata()
+    meta.update(timeout_s=args.timeout, budget_s=args.budget, startup_s=round(startup, 6))
+    print(f"interpreter startup: {startup * 1000:.1f}ms (subtracted before fitting)\n")
+    print(f"{'solution':<28} {'points':>6} {'k':>7} {'target':>12} {'10x target':>12}")
+
+    results, rows = [], []
+    for s in solutions:
+        res = sweep(s, spec_for(s.id), timeout=args.timeout, factor=args.factor,
+                    budget=args.budget, startup=startup)
+        k = "-" if res.exponent is None else f"{res.exponent:.2f}"
+        t1 = "-" if res.predicted_target_s is None else f"{res.predicted_target_s:.3g}s"
+        t10 = "-" if res.predicted_10x_s is None else f"{res.predicted_10x_s:.3g}s"
+        print(f"{s.id:<28} {len(res.points):>6} {k:>7} {t1:>12} {t10:>12}", flush=True)
+        results.append(res.to_dict())
+        rows.extend({"id": s.id, "exponent": res.exponent, **p} for p in res.points)
+
+    json_path, csv_path = write_run(results, meta, args.out, kind="scaling",
+                                    rows=rows, fields=SCALING_CSV_FIELDS)
+    print(f"\nwrote {json_path}\nwrote {csv_path}")
+    return 0
+
+
+def cmd_bench(args) -> int:
+    solutions = [s for s in find_solutions(args.patterns) if spec_for(s.id)]
+    if not solutions:
+        print("no solutions with a size spec match", file=sys.stderr)
+        return 1
+
+    meta = run_metadata()
+    meta.update(warmup=args.warmup, repeat=args.repeat, size=args.size)
+    print(f"{'solution':<28} {'min':>10} {'median':>10}  verification")
+    results = []
+    registry = answers.load_registry()
+    for s in solutions:
+        spec = spec_for(s.id)
+        params = spec.target_params if args.size is None else spec.scale(args.size)
+        r = time_solve(s, params, warmup=args.warmup, repeat=args.repeat)
+        r.verification = answers.verify(s.group, spec, params, r.answer, registry)
+        print(f"{s.id:<28} {r.min_s:>9.4f}s {r.median_s:>9.4f}s  {r.verification}", flush=True)
+        results.append(r.to_dict())
+
+    json_path, csv_path = write_run(results, meta, args.out, kind="inprocess",
+                                    fields=INPROCESS_CSV_FIELDS)
+    print(f"\nwrote {json_path}\nwrote {csv_path}")
+    return 0
+
+
+def cmd_diff(args) -> int:
+    groups: dict[str, list] = {}
+    for s in find_solutions(args.patterns):
+        if s.group in SHARED_SIZES and spec_for(s.id):
+            groups.setdefault(s.group, []).append(s)
+    groups = {g: sols for g, sols in groups.items() if len(sols) >= 2}
+    if not groups:
+        print("no group with two or more matching solutions", file=sys.stderr)
+        return 1
+
+    meta = run_metadata()
+    meta.update(repeat=args.repeat, budget_s=args.budget)
+    results = []
+    for group, sols in groups.items():
+        models = [s.model for s in sols]
+        print(f"\n{group}: time (ratio to fastest agreeing model), ! = disagrees, "
+              f"? = no reference answer")
+        print(f"{'size':>10}  " + "".join(f"{m:>22}" for m in models))
+        points = compare_group(group, sols, repeat=args.repeat, budget=args.budget)
+        for size in SHARED_SIZES[group]:
+            cells = []
+            for p in (p for p in points if p.size == size):
+                if p.time_s is None:
+                    cells.append(f"{'error' if p.error else '-':>22}")
+                    continue
+                ratio = "" if p.ratio is None else f" ({p.ratio:.1f}x)"
+                flag = {False: "!", None: "?"}.get(p.agrees, " ")
+                cells.append(f"{f'{p.time_s:.4f}s{ratio}{flag}':>22}")
+            print(f"{size:>10}  " + "".join(cells), flush=True)
+        results.extend(p.to_dict() for p in points)
+
+    json_path, csv_path = write_run(results, meta, args.out, kind="differential",
+                                    fields=DIFF_CSV_FIELDS)
+    print(f"\nwrote {json_path}\nwrote {csv_path}")
+    return 0
+
+
+def cmd_check(args) -> int:
+    """Run every public small case in-process against each matching solution."""
+    failures = 0
+    for s in find_solutions(args.patterns):
+        spec = spec_for(s.id)
+        if spec is None:
+            continue
+        for check, expected in answers.all_checks(s.group):
+            params = spec.check_params(check)
+            if params is None:
+                continue
+            got = answers.normalize(s.group, call_quietly(load_module(s).solve, params))
+            ok = got == expected
+            failures += not ok
+            print(f"{s.id:<28} {json.dumps(check):<24} {'ok' if ok else 'FAIL'}"
+                  + ("" if ok else f"  got {got}, expected {expected}"), flush=True)
+    return 1 if failures else 0
+
+
+def cmd_simulate(args) -> int:
+    """Estimate 5_percent's P(R, B) by simulating the game, and test every solution against it."""
+    est = montecarlo.estimate(args.R, args.B, games=args.games, workers=args.workers,
+                              seed=args.seed, confidence=args.confidence)
+    print(f"P({args.R},{args.B}) ~ {est.p:.6f}, {100 * args.confidence:g}% interval "
+          f"[{est.lo:.6f}, {est.hi:.6f}] from {est.games} games (seed {est.seed})")
+    outside = 0
+    for s in find_solutions(["5_percent/*"]):
+        got = float(call_quietly(load_module(s).solve, {"R": args.R, "B": args.B}))
+        ok = est.covers(got)
+        outside += not ok
+        print(f"{s.id:<28} {got:.10f}  {'ok' if ok else 'OUTSIDE'}", flush=True)
+    return 1 if outside else 0
+
+
+def cmd_leaderboard(args) -> int:
+    """Verified timings from one results file, fastest first within each group."""
+    if args.file:
+        with open(args.file) as fh:
+            run = json.load(fh)
+    else:
+        runs = load_runs(args.out, kind=args.kind)
+        if not runs:
+            print(f"no {args.kind} results under {args.out}", file=sys.stderr)
+            return 1
+        run = runs[-1]
+
+    time_key = "wall_s" if args.kind == "runs" else "median_s"
+    board: dict[str, list[dict]] = {}
+    for r in run["results"]:
+        if r.get("verification") == answers.VERIFIED:
+            board.setdefault(r["id"].split("/")[0], []).append(r)
+
+    meta = run["meta"]
+    print(f"leaderboard for {meta.get('started_at')} (commit {(meta.get('commit') or '?')[:8]}),"
+          f" verified results only\n")
+    for group, rows in board.items():
+        print(group)
+        for rank, r in enumerate(sorted(rows, key=lambda r: r[time_key]), 1):
+            print(f"  {rank}. {r['id'].split('/')[1]:<12} {r[time_key]:>10.4f}s")
+    excluded = sum(1 for r in run["results"] if r.get("verification") != answers.VERIFIED)
+    print(f"\n{excluded} result(s) excluded as wrong or unverifiable")
+    return 0
+
+
+def cmd_report(args) -> int:
+    page = report.build(args.out)
+    print(f"wrote {page}")
+    if args.readme:
+        readme = REPO_ROOT / "benchmarking" / "readme.md"
+        report.update_readme(readme, args.out)
+        print(f"updated {readme}")
+    return 0
+
+
+def cmd_answers_set(args) -> int:
+    answers.set_target_answer(args.group, args.answer)
+    print(f"stored salted hash for {args.group} in {answers.ANSWERS_FILE}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m harness", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("list", help="list discovered solutions")
+    p.add_argument("patterns", nargs="*", help="glob(s) on solution id")
+    p.set_defaults(func=cmd_list)
+
+    p = sub.add_parser("run", help="run each solution in its own subprocess")
+    p.add_argument("patterns", nargs="*", help="glob(s) on solution id")
+    p.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                   help=f"per-solution timeout in seconds (default {DEFAULT_TIMEOUT:g})")
+    p.add_argument("--out", default=DEFAULT_OUT_DIR, help="results directory")
+    p.add_argument("--profile", action="store_true",
+                   help="call solve() under cProfile and tracemalloc and write hot-path reports "
+                        "to <out>/profiles (timings are inflated)")
+    p.add_argument("--jobs", "-j", type=int, default=1,
+                   help="solutions to run at once, one pinned core each (default 1)")
+    p.add_argument("--repeat", type=int, default=1,
+                   help="runs in total for each solution faster than --short (default 1)")
+    p.add_argument("--short", type=float, default=DEFAULT_SHORT_S,
+                   help=f"seconds below which a solution is repeated (default {DEFAULT_SHORT_S:g})")
+    p.add_argument("--no-pin", action="store_true",
+                   help="do not pin solutions to a core (for ones that use several)")
+    p.add_argument("--force", action="store_true",
+                   help="re-run solutions even if a cached result matches their source")
+    p.add_argument("--memory-limit", type=int, default=None, metavar="MB",
+                   help="cap each solution's address space (RLIMIT_AS) at this many MB")
+    p.add_argument("--memory-tolerance", type=float, default=DEFAULT_TOLERANCE,
+                   help="relative peak-RSS growth over the baseline that raises an alarm "
+                        f"(default {DEFAULT_TOLERANCE:g})")
+    p.add_argument("--save-memory-baseline", action="store_true",
+                   help="record this run's peak RSS as the baseline for later alarms")
+    p.set_defaults(func=cmd_run)
+
+    p = sub.add_parser("scale", help="sweep problem sizes and fit a complexity exponent")
+    p.add_argument("patterns", nargs="*", help="glob(s) on solution id")
+    p.add_argument("--factor", type=float, default=None,
+                   help="geometric step between sizes (default: per-solution)")
+    p.add_argument("--budget", type=float, default=30.0,
+                   help="stop a sweep once one size takes longer than this (seconds)")
+    p.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                   help=f"per-run timeout in seconds (default {DEFAULT_TIMEOUT:g})")
+    p.add_argument("--out", default=DEFAULT_OUT_DIR, help="results directory")
+    p.set_defaults(func=cmd_scale)
+
+    p = sub.add_parser("bench", help="time solve() repeatedly inside this process")
+    p.add_argument("patterns", nargs="*", help="glob(s) on solution id")
+    p.add_argument("--size", type=int, default=None,
+                   help="problem size passed through the solution's spec (default: target)")
+    p.add_argument("--warmup", type=int, default=1, help="untimed calls first (default 1)")
+    p.add_argument("--repeat", type=int, default=5, help="timed calls (default 5)")
+    p.add_argument("--out", default=DEFAULT_OUT_DIR, help="results directory")
+    p.set_defaults(func=cmd_bench)
+
+    p = sub.add_parser("diff", help="compare every model of a group on shared small sizes")
+    p.add_argument("patterns", nargs="*", help="glob(s) on solution id")
+    p.add_argument("--repeat", type=int, default=3, help="timed calls per point (default 3)")
+    p.add_argument("--budget", type=float, default=10.0,
+                   help="drop a model from larger sizes once a call takes this long (seconds)")
+    p.add_argument("--out", default=DEFAULT_OUT_DIR, help="results directory")
+    p.set_defaults(func=cmd_diff)
+
+    p = sub.add_parser("check", help="run the public small cases from the problem statements")
+    p.add_argument("patterns", nargs="*", help="glob(s) on solution id")
+    p.set_defaults(func=cmd_check)
+
+    p = sub.add_parser("simulate", help="Monte Carlo estimate of 5_percent's P(R, B)")
+    p.add_argument("R", type=int)
+    p.add_argument("B", type=int)
+    p.add_argument("--games", type=int, default=10**7, help="simulated games (default 10^7)")
+    p.add_argument("--workers", "-j", type=int, default=1,
+                   help="processes to spread the shards over (default 1)")
+    p.add_argument("--seed", type=int, default=0, help="root of the shard seeds (default 0)")
+    p.add_argument("--confidence", type=float, default=0.99,
+                   help="level of the reported interval (default 0.99)")
+    p.set_defaults(func=cmd_simulate)
+
+    p = sub.add_parser("leaderboard", help="rank verified timings from a results file")
+    p.add_argument("file", nargs="?", help="results JSON (default: latest of --kind)")
+    p.add_argument("--kind", choices=["runs", "inprocess"], default="runs")
+    p.add_argument("--out", default=DEFAULT_OUT_DIR, help="results directory")
+    p.set_defaults(func=cmd_leaderboard)
+
+    p = sub.add_parser("report", help="render an offline HTML/Markdown report from stored results")
+    p.add_argument("--out", default=DEFAULT_OUT_DIR, help="results directory")
+    p.add_argument("--readme", action="store_true",
+                   help="also refresh the measured-results table in benchmarking/readme.md")
+    p.set_defaults(func=cmd_report)
+
+    p = sub.add_parser("answers", help="manage the hashed expected-answer registry")
+    answers_sub = p.add_subparsers(dest="answers_command", required=True)
+    q = answers_sub.add_parser("set", help="record the accepted answer for a group")
+    q.add_argument("group", help="e.g. 5_percent or test_case_easy")
+    q.add_argument("answer")
+    q.set_defaults(func=cmd_answers_set)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""
+Pin and cap a process, then exec it: `python _launch.py [--cpu C] [--as-mb M] -- argv...`
+
+The runner starts solutions through this script instead of doing the same work
+in a `preexec_fn`, which is not safe to run in the fork of a threaded harness.
+The exec keeps the pid, so the runner still waits on and measures the solution
+itself; the pinning and the RLIMIT_AS cap are inherited across the exec. Only
+the standard library is imported, to keep the extra interpreter start short.
+"""
+
+import os
+import resource
+import sys
+
+
+def main(argv: list[str]) -> None:
+    split = argv.index("--")
+    options, command = argv[:split], argv[split + 1:]
+    for flag, value in zip(options[::2], options[1::2]):
+        if flag == "--cpu" and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, {int(value)})
+            except OSError:
+                pass  # the core is not ours
+        elif flag == "--as-mb":
+            limit = int(value) * 2**20
+            try:
+                resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+            except (OSError, ValueError):
+                pass  # above the hard limit we inherited
+    os.execv(command[0], command)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
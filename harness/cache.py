@@ -0,0 +1,78 @@
+"""
+Content-addressed cache of run results.
+
+A result is stored under a key that hashes everything that can change it:
+  - the solution's source,
+  - the source of every repository package or module it imports,
+  - its parameters,
+  - the interpreter (implementation and full version string),
+  - the memory limit it ran under, if any, since an ok result without a cap
+    says nothing about whether the run fits under one.
+An unchanged solution is not run again. Editing one file only invalidates the
+solutions that depend on it. Only successful runs are cached, because failures
+and timeouts are worth retrying. The timeout is not part of the key: `run`
+accepts a hit only if its recorded wall times fit within the current one.
+
+Entries live in `<out_dir>/cache/<key[:2]>/<key>.json`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import platform
+import re
+import sys
+from pathlib import Path
+
+from harness.discover import REPO_ROOT, Solution
+
+_IMPORT = re.compile(r"^\s*(?:from|import)\s+([A-Za-z_]\w*)", re.MULTILINE)
+
+
+def _local_sources(source: str, root: Path = REPO_ROOT) -> list[Path]:
+    """Repository files behind the top-level names imported by `source`."""
+    found = []
+    for name in sorted(set(_IMPORT.findall(source))):
+        package, module = root / name, root / f"{name}.py"
+        if (package / "__init__.py").exists():
+            found.extend(sorted(package.rglob("*.py")))
+        elif module.exists():
+            found.append(module)
+    return found
+
+
+def cache_key(solution: Solution, params: dict | None, memory_limit_mb: int | None = None) -> str:
+    h = hashlib.sha256()
+    source = solution.path.read_bytes()
+    h.update(source)
+    for path in _local_sources(source.decode(errors="replace")):
+        h.update(path.relative_to(REPO_ROOT).as_posix().encode())
+        h.update(path.read_bytes())
+    h.update(json.dumps(params or {}, sort_keys=True).encode())
+    h.update(f"{platform.python_implementation()} {sys.version}".encode())
+    if memory_limit_mb is not None:  # uncapped keys stay as they were
+        h.update(f"RLIMIT_AS {memory_limit_mb}MB".encode())
+    return h.hexdigest()
+
+
+def _entry(out_dir: Path, key: str) -> Path:
+    return Path(out_dir) / "cache" / key[:2] / f"{key}.json"
+
+
+def load(out_dir: Path, key: str) -> dict | None:
+    path = _entry(out_dir, key)
+    if not path.exists():
+        return None
+    with open(path) as fh:
+        return json.load(fh)
+
+
+def store(out_dir: Path, key: str, result: dict) -> None:
+    if result.get("status") != "ok":
+        return
+    path = _entry(out_dir, key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as fh:
+        json.dump(result, fh, indent=2)
+        fh.write("\n")
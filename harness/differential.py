@@ -0,0 +1,106 @@
+"""
+Differential benchmark: call every model's `solve` in a difficulty group on the
+same sweep of small sizes, check that the answers agree and compare the times.
+
+At each size the reference answer is the public check for those parameters, if
+there is one (see `harness.answers.CHECKS`), otherwise the most common answer
+among the models. Each model's time is reported as a ratio to the fastest model
+that agreed at that size (or to the fastest model, when there is no reference),
+so the cost of each algorithmic choice can be read off as the size grows.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import asdict, dataclass
+
+from harness import answers
+from harness.discover import Solution
+from harness.inprocess import time_solve
+from harness.specs import spec_for
+
+# Sizes (in each spec's `scale` units) that every model in the group can run.
+SHARED_SIZES: dict[str, list[int]] = {
+    "5_percent": [2, 4, 8, 16, 32, 64],
+    "10_percent": [3, 4, 5, 6, 7],
+    "20_percent": [10, 100, 1000],
+    "30_percent": [10**3, 10**4, 10**5],
+    "40_percent": [10, 100, 10**3, 10**4],
+    "50_percent": [2, 3, 4, 6, 8],
+    "60_percent": [10**3, 10**4, 10**5],
+    "test_case_easy": [100, 1000, 10**4],
+    "test_case_hard": [5, 10, 20, 40, 80, 160],
+}
+
+
+@dataclass
+class DiffPoint:
+    group: str
+    size: int
+    model: str
+    params: dict
+    answer: str | None  # normalized
+    time_s: float | None  # best of the repeats; None if skipped
+    agrees: bool | None = None  # None: skipped, or no reference at this size
+    ratio: float | None = None  # time_s / fastest agreeing (or, without a reference, any) model
+    error: str | None = None  # exception raised by solve, if any
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _reference(group: str, points: list[DiffPoint]) -> str | None:
+    for p in points:
+        expected = answers.checks_for(group, p.params)
+        if expected:
+            return expected[0]
+    counts = Counter(p.answer for p in points if p.answer is not None)
+    if not counts:
+        return None
+    (top, n), *rest = counts.most_common()
+    return None if rest and rest[0][1] == n else top  # a tie has no majority
+
+
+def compare_group(group: str, solutions: list[Solution], sizes: list[int] | None = None,
+                  repeat: int = 3, budget: float = 10.0) -> list[DiffPoint]:
+    """
+    Time every solution of `group` at each shared size, smallest first.
+
+    A model is dropped from larger sizes once one call takes over `budget`
+    seconds or raises; its remaining points are kept with `time_s=None`.
+    """
+    sizes = sizes if sizes is not None else SHARED_SIZES[group]
+    dropped: set[str] = set()
+    points = []
+    for size in sizes:
+        row = []
+        for s in solutions:
+            params = spec_for(s.id).scale(size)
+            if s.model in dropped:
+                row.append(DiffPoint(group, size, s.model, params, None, None))
+                continue
+            try:
+                r = time_solve(s, params, warmup=0, repeat=repeat)
+            except Exception as e:  # a broken model should not stop the comparison
+                dropped.add(s.model)
+                row.append(DiffPoint(group, size, s.model, params, None, None,
+                                     error=f"{type(e).__name__}: {e}"))
+                continue
+            if r.min_s > budget:
+                dropped.add(s.model)
+            row.append(DiffPoint(group, size, s.model, params,
+                                 answers.normalize(group, r.answer), r.min_s))
+
+        want = _reference(group, [p for p in row if p.time_s is not None])
+        for p in row:
+            if p.time_s is not None and want is not None:
+                p.agrees = p.answer == want
+        timed = [p.time_s for p in row if p.time_s is not None]
+        agreeing = [p.time_s for p in row if p.agrees] if want is not None else timed
+        if agreeing:
+            fastest = max(min(agreeing), 1e-9)
+            for p in row:
+                if p.time_s is not None:
+                    p.ratio = round(p.time_s / fastest, 3)
+        points.extend(row)
+    return points
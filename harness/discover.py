@@ -0,0 +1,65 @@
+"""Locate the solution scripts that make up the benchmark suite."""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Directories (relative to the repository root) whose children hold solutions.
+# `benchmarking` has one subdirectory per difficulty level, the test cases are flat.
+SEARCH_GLOBS = (
+    "benchmarking/*/solution_*.py",
+    "test_case_easy/solution_*.py",
+    "test_case_hard/solution_*.py",
+)
+
+
+@dataclass(frozen=True)
+class Solution:
+    """A single solution script, e.g. `benchmarking/5_percent/solution_chat.py`."""
+
+    path: Path
+    group: str  # difficulty directory, e.g. "5_percent" or "test_case_easy"
+    model: str  # suffix after `solution_`, e.g. "chat" or "gemini_2"
+
+    @property
+    def id(self) -> str:
+        return f"{self.group}/{self.model}"
+
+    @property
+    def relpath(self) -> str:
+        try:
+            return self.path.relative_to(REPO_ROOT).as_posix()
+        except ValueError:
+            return self.path.as_posix()
+
+
+def group_key(group: str):
+    # Sort difficulty levels numerically ("5_percent" before "10_percent"),
+    # then the test cases.
+    m = re.match(r"(\d+)_percent$", group)
+    return (0, int(m.group(1)), group) if m else (1, 0, group)
+
+
+def find_solutions(patterns=None, root: Path = REPO_ROOT) -> list[Solution]:
+    """
+    Return all solution scripts under `root`, ordered by difficulty then model.
+
+    `patterns` is an optional list of shell-style globs matched against the
+    solution id (e.g. `"5_percent/*"` or `"*/chat"`); a solution is kept if it
+    matches any of them.
+    """
+    found = []
+    for pattern in SEARCH_GLOBS:
+        for path in root.glob(pattern):
+            model = path.stem[len("solution_"):]
+            found.append(Solution(path=path, group=path.parent.name, model=model))
+
+    if patterns:
+        found = [s for s in found if any(fnmatch.fnmatch(s.id, p) for p in patterns)]
+
+    return sorted(found, key=lambda s: (group_key(s.group), s.model))
@@ -0,0 +1,86 @@
+"""
+In-process timing: import a solution once and call its `solve(**params)` many
+times, so that repeated samples do not pay for interpreter startup.
+
+Every solution module is import-safe (no work at import time) and exposes
+`solve(**params)` returning the answer, with keyword names matching
+`harness.specs`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.util
+import io
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from types import ModuleType
+
+from harness.discover import REPO_ROOT, Solution
+
+_loaded: dict[str, ModuleType] = {}
+
+
+@dataclass
+class InProcessResult:
+    id: str
+    params: dict
+    warmup: int
+    answer: str | None
+    samples_s: list[float] = field(default_factory=list)  # wall time per call
+    cpu_samples_s: list[float] = field(default_factory=list)  # process CPU time per call
+    verification: str | None = None  # set by harness.answers.verify
+
+    @property
+    def min_s(self) -> float:
+        return min(self.samples_s)
+
+    @property
+    def median_s(self) -> float:
+        return statistics.median(self.samples_s)
+
+    def to_dict(self) -> dict:
+        d = asdict(self)
+        d.update(min_s=round(self.min_s, 6), median_s=round(self.median_s, 6),
+                 repeat=len(self.samples_s))
+        return d
+
+
+def load_module(solution: Solution) -> ModuleType:
+    """Import a solution script by path (cached); its directory names are not valid packages."""
+    if solution.id in _loaded:
+        return _loaded[solution.id]
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    name = f"_solution_{solution.group}_{solution.model}"
+    spec = importlib.util.spec_from_file_location(name, solution.path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    _loaded[solution.id] = module
+    return module
+
+
+def call_quietly(fn, params: dict):
+    """Call `fn(**params)` with anything it prints swallowed."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(**params)
+
+
+def time_solve(solution: Solution, params: dict, warmup: int = 1, repeat: int = 5) -> InProcessResult:
+    """Warm up `warmup` times, then time `repeat` calls of `solve(**params)`."""
+    solve = load_module(solution).solve
+    for _ in range(warmup):
+        call_quietly(solve, params)
+
+    result = InProcessResult(id=solution.id, params=params, warmup=warmup, answer=None)
+    answer = None
+    for _ in range(repeat):
+        cpu0, t0 = time.process_time(), time.perf_counter()
+        answer = call_quietly(solve, params)
+        result.samples_s.append(time.perf_counter() - t0)
+        result.cpu_samples_s.append(time.process_time() - cpu0)
+    result.answer = None if answer is None else str(answer)
+    return result
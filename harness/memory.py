@@ -0,0 +1,85 @@
+"""
+Peak-memory baselines and regression alarms.
+
+`python -m harness run --save-memory-baseline` records each solution's peak RSS
+in `<out_dir>/baselines/peak_rss.json`. Every later run compares against it
+and raises an alarm for any solution whose peak grew by more than `tolerance`
+(relative) and `slack_kb` (absolute). The absolute slack is there because small
+scripts all sit near the harness's own ~15-20MB floor and jitter by a few MB.
+This catches a solution heading towards an OOM while it is still being run at
+small sizes.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_TOLERANCE = 0.2
+DEFAULT_SLACK_KB = 10 * 1024
+
+
+@dataclass
+class MemoryAlarm:
+    id: str
+    baseline_kb: int
+    peak_kb: int
+
+    @property
+    def growth(self) -> float:
+        return self.peak_kb / self.baseline_kb - 1
+
+    def __str__(self) -> str:
+        return (f"{self.id}: peak RSS {self.peak_kb / 1024:.1f}MB, baseline "
+                f"{self.baseline_kb / 1024:.1f}MB (+{self.growth:.0%})")
+
+
+def baseline_path(out_dir: Path) -> Path:
+    return Path(out_dir) / "baselines" / "peak_rss.json"
+
+
+def load_baseline(out_dir: Path) -> dict[str, dict]:
+    """id -> {"params": ..., "peak_rss_kb": ...}; empty if no baseline was saved."""
+    path = baseline_path(out_dir)
+    if not path.exists():
+        return {}
+    with open(path) as fh:
+        return json.load(fh)
+
+
+def save_baseline(results: list[dict], out_dir: Path) -> Path:
+    """Merge the peaks of successful `results` into the stored baseline."""
+    baseline = load_baseline(out_dir)
+    for r in results:
+        if r["status"] == "ok":
+            baseline[r["id"]] = {"params": r.get("params"), "peak_rss_kb": r["peak_rss_kb"]}
+    path = baseline_path(out_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as fh:
+        json.dump(baseline, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+    return path
+
+
+def memory_alarms(results: list[dict], baseline: dict[str, dict],
+                  tolerance: float = DEFAULT_TOLERANCE,
+                  slack_kb: int = DEFAULT_SLACK_KB) -> list[MemoryAlarm]:
+    """
+    Results whose peak RSS grew past the baseline taken at the same parameters.
+
+    Runs that hit the memory cap count as growth as well, because their true
+    peak is at least the cap.
+    """
+    alarms = []
+    for r in results:
+        base = baseline.get(r["id"])
+        if base is None or base.get("params") != r.get("params"):
+            continue
+        peak = r["peak_rss_kb"]
+        if r["status"] == "memory" and r.get("memory_limit_mb"):
+            peak = max(peak, r["memory_limit_mb"] * 1024)
+        limit = max(base["peak_rss_kb"] * (1 + tolerance), base["peak_rss_kb"] + slack_kb)
+        if peak > limit:
+            alarms.append(MemoryAlarm(r["id"], base["peak_rss_kb"], peak))
+    return alarms
@@ -0,0 +1,101 @@
+"""
+Monte Carlo check for the red/black card game of 5_percent (Project Euler 938).
+
+Each game is one NumPy lane, stepped until one colour is gone. A BB draw leaves
+the state unchanged, so it is skipped: from (r, b) the next state-changing draw
+is RR with probability (r-1) / (r-1 + 2b) and RB otherwise. That is the game
+itself, not the closed form the solutions derive from it, so the estimate is an
+independent check of any P(R, B), including for changed rules.
+
+Trials are split into shards, and each shard gets its own generator spawned
+from one `SeedSequence`. Shards can run in a process pool, and the result does
+not depend on the number of workers. The estimate comes with a Wilson score
+interval.
+"""
+
+from __future__ import annotations
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from statistics import NormalDist
+
+SHARD_GAMES = 1 << 20  # games per shard, and per batch of lanes inside it
+
+
+@dataclass
+class Estimate:
+    R: int
+    B: int
+    games: int
+    black_wins: int
+    p: float
+    lo: float  # Wilson interval at `confidence`
+    hi: float
+    confidence: float
+    seed: int
+
+    def covers(self, value: float) -> bool:
+        return self.lo <= value <= self.hi
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def play(R: int, B: int, games: int, rng) -> int:
+    """Play `games` games from (R, B) side by side; returns how many end all black."""
+    import numpy as np
+
+    r = np.full(games, R, dtype=np.int64)
+    b = np.full(games, B, dtype=np.int64)
+    black = 0
+    while r.size:
+        rr = rng.random(r.size) * (r - 1 + 2 * b) < r - 1
+        r -= 2 * rr
+        b -= ~rr
+        # b < 0 or no cards left to draw only follow from starts with no game
+        # to play; they end the lane instead of stepping it forever
+        over = (r == 0) | (b <= 0) | (r - 1 + 2 * b <= 0)
+        if over.any():
+            black += int(np.count_nonzero((r[over] == 0) & (b[over] > 0)))
+            r, b = r[~over], b[~over]
+    return black
+
+
+def _shard(R: int, B: int, games: int, seed) -> int:
+    import numpy as np
+
+    return play(R, B, games, np.random.default_rng(seed))
+
+
+def wilson(wins: int, games: int, confidence: float) -> tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = wins / games
+    centre = (p + z * z / (2 * games)) / (1 + z * z / games)
+    half = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / (1 + z * z / games)
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def estimate(R: int, B: int, games: int = 10**7, workers: int = 1, seed: int = 0,
+             confidence: float = 0.99) -> Estimate:
+    """Estimate P(R, B) from `games` simulated games, in shards of SHARD_GAMES."""
+    import numpy as np
+
+    if R < 0 or B < 0 or games < 1:
+        raise ValueError("need R, B >= 0 and at least one game")
+    if R == 0 or B == 0:  # over before the first draw: all black only if no red
+        p = 1.0 if R == 0 < B else 0.0
+        return Estimate(R, B, games, round(p * games), p, p, p, confidence, seed)
+    sizes = [SHARD_GAMES] * (games // SHARD_GAMES)
+    if games % SHARD_GAMES:
+        sizes.append(games % SHARD_GAMES)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = ([R] * len(sizes), [B] * len(sizes), sizes, seeds)
+    if workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(min(workers, len(sizes))) as pool:
+            wins = sum(pool.map(_shard, *args))
+    else:
+        wins = sum(map(_shard, *args))
+    lo, hi = wilson(wins, games, confidence)
+    return Estimate(R, B, games, wins, wins / games, lo, hi, confidence, seed)
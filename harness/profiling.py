@@ -0,0 +1,179 @@
+"""
+Hot-path reports: call a solution's `solve(**params)` once under cProfile and
+tracemalloc and write what was found next to the other results.
+
+For each solution `<group>/<model>` this writes, under `<out_dir>/profiles/<group>/`:
+
+  <model>.pstats     raw cProfile data (`python -m pstats`, snakeviz, ...)
+  <model>.collapsed  approximate collapsed stacks ("a;b;c <microseconds>"),
+                     rebuilt from caller edges, for flamegraph.pl or speedscope
+  <model>.txt        top functions by cumulative and own time, the top
+                     allocation sites and the tracemalloc peak
+
+The profile is taken in a fresh interpreter (`run --profile` starts this module
+as the subprocess) so that caches filled by an earlier run cannot hide work.
+Both tracers slow the solution down, allocation-heavy code the most, so the
+timings here are for finding hot spots, not for the leaderboard.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import pstats
+import sys
+import threading
+import tracemalloc
+from pathlib import Path
+
+from harness.discover import Solution, find_solutions
+from harness.inprocess import load_module
+
+TOP = 25  # rows per table in the text report
+TRACE_FRAMES = 1  # tracemalloc frames kept per allocation; 1 keeps the overhead low
+SAMPLE_INTERVAL = 0.05  # seconds between checks for a new memory high
+
+
+def _label(func: tuple) -> str:
+    filename, line, name = func
+    if filename == "~":  # built-in
+        return name.strip("<>")
+    return f"{name} ({Path(filename).name}:{line})"
+
+
+def collapsed_stacks(stats: pstats.Stats, max_depth: int = 64,
+                     min_share: float = 1e-4) -> dict[str, float]:
+    """
+    Approximate collapsed stacks from cProfile's caller graph.
+
+    cProfile only records caller -> callee edges, not whole stacks, so each
+    function's own time is spread over its callers in proportion to the time
+    spent in it from each caller, recursively up to a root. The output is an
+    estimate, not a record of the stacks that actually ran. Recursion is cut at
+    the first repeated frame. A branch carrying less than `min_share` of the
+    total profiled time is not extended further and is reported at the depth
+    reached, which keeps the walk bounded on graphs with many paths between the
+    same functions (a plain walk is exponential in the depth there).
+    """
+    raw = stats.stats  # func -> (cc, nc, tottime, cumtime, callers)
+    out: dict[str, float] = {}
+    floor = min_share * sum(entry[2] for entry in raw.values())
+
+    def walk(func, weight: float, path: tuple) -> list[tuple[tuple, float]]:
+        callers = raw[func][4]
+        edges = [(c, e[3]) for c, e in callers.items() if c in raw and c not in path]
+        total = sum(t for _, t in edges)
+        if not edges or total <= 0 or len(path) >= max_depth or weight < floor:
+            return [(path, weight)]
+        found = []
+        for caller, t in edges:
+            found.extend(walk(caller, weight * t / total, (caller, *path)))
+        return found
+
+    for func, (_, _, tottime, _, _) in raw.items():
+        if tottime <= 0:
+            continue
+        for path, weight in walk(func, tottime, (func,)):
+            key = ";".join(_label(f) for f in path)
+            out[key] = out.get(key, 0.0) + weight
+    return out
+
+
+class _PeakSnapshots(threading.Thread):
+    """
+    Keep a tracemalloc snapshot from near the memory peak.
+
+    A snapshot taken after `solve` returns only shows what is still alive, which
+    misses the temporary tables that usually set the peak. This thread polls the
+    traced size and re-snapshots whenever it has grown by a tenth since the last
+    snapshot, so there are only a handful of (possibly expensive) snapshots.
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.stop = threading.Event()
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.size = 0
+
+    def run(self):
+        while not self.stop.wait(SAMPLE_INTERVAL):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > 1.1 * self.size:
+                self.snapshot, self.size = tracemalloc.take_snapshot(), current
+
+
+def profile_solve(solution: Solution, params: dict, out_dir: Path, top: int = TOP) -> dict:
+    """Profile one `solve(**params)` call and write the three reports; returns a summary."""
+    solve = load_module(solution).solve
+    profiler = cProfile.Profile()
+    tracemalloc.start(TRACE_FRAMES)
+    sampler = _PeakSnapshots()
+    sampler.start()
+    profiler.enable()
+    try:
+        answer = solve(**params)
+    finally:
+        profiler.disable()
+        sampler.stop.set()
+        sampler.join()
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot, snapshot_size = sampler.snapshot, sampler.size
+        if snapshot is None or current >= snapshot_size:
+            snapshot, snapshot_size = tracemalloc.take_snapshot(), current
+        tracemalloc.stop()
+
+    dest = Path(out_dir) / "profiles" / solution.group
+    dest.mkdir(parents=True, exist_ok=True)
+    stem = dest / solution.model
+
+    profiler.dump_stats(stem.with_suffix(".pstats"))
+    stats = pstats.Stats(profiler)
+    with open(stem.with_suffix(".collapsed"), "w") as fh:
+        for key, seconds in sorted(collapsed_stacks(stats).items()):
+            micros = round(seconds * 1e6)
+            if micros:
+                fh.write(f"{key} {micros}\n")
+
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+    sites = snapshot.statistics("lineno")[:top]
+
+    report = io.StringIO()
+    report.write(f"{solution.id}  params={json.dumps(params)}\n")
+    report.write(f"total {stats.total_tt:.3f}s under cProfile, tracemalloc peak "
+                 f"{peak / 2**20:.1f}MB\n\n")
+    for sort in ("cumulative", "tottime"):
+        report.write(f"== top {top} functions by {sort} time ==\n")
+        pstats.Stats(profiler, stream=report).sort_stats(sort).print_stats(top)
+    report.write(f"== top {top} allocation sites at {snapshot_size / 2**20:.1f}MB traced ==\n")
+    for stat in sites:
+        frame = stat.traceback[0]
+        report.write(f"{stat.size / 2**20:>10.2f}MB {stat.count:>10} blocks  "
+                     f"{frame.filename}:{frame.lineno}\n")
+    stem.with_suffix(".txt").write_text(report.getvalue())
+
+    return {
+        "id": solution.id,
+        "answer": None if answer is None else str(answer),
+        "profile_s": round(stats.total_tt, 6),
+        "tracemalloc_peak_kb": peak // 1024,
+        "report": str(stem.with_suffix(".txt")),
+    }
+
+
+def main(argv: list[str]) -> int:
+    """`python -m harness.profiling <solution id> <out dir> <params json>`"""
+    solution_id, out_dir, params = argv
+    (solution,) = find_solutions([solution_id])
+    summary = profile_solve(solution, json.loads(params), Path(out_dir))
+    print(json.dumps(summary), file=sys.stderr)
+    print(summary["answer"])  # last line, picked up as the answer by the runner
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
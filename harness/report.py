@@ -0,0 +1,271 @@
+"""
+Static benchmark report built from the stored JSON alone.
+
+`python -m harness report` reads every run under `<out_dir>/runs` and
+`<out_dir>/scaling` and writes `<out_dir>/report/`:
+
+  index.html       self-contained page (inline SVG, no scripts or external assets)
+  README.md        the same content in Markdown, pointing at the SVG files
+  *.svg            per difficulty group: wall time and peak RSS across runs
+                   (one point per run, labelled by commit) and the latest
+                   scaling sweep of each model on log-log axes
+
+Both documents start with a regenerated version of the results table in
+`benchmarking/readme.md`. Its cells hold the measured time and verification
+status of the latest run in place of the hand-written notes. Nothing depends on the clock
+or the network, so the same stored data always renders the same report.
+"""
+
+from __future__ import annotations
+
+import html
+import math
+from pathlib import Path
+
+from harness.discover import group_key
+from harness.results import DEFAULT_OUT_DIR, load_runs
+
+# Column order and headings of the table in benchmarking/readme.md.
+MODELS = [("claude", "Claude Opus 4.1"), ("chat", "ChatGPT 5 Pro"), ("gemini", "Gemini 2.5 Pro")]
+
+STATUS_MARK = {"verified": "✅", "wrong": "❌", "unverifiable": "⚠️"}
+
+LEGEND = ("✅ verified, ❌ wrong or failed, ⚠️ unverifiable; "
+          "times are wall clock of the latest run.")
+
+README_START = "<!-- measured-results:start -->"
+README_END = "<!-- measured-results:end -->"
+
+_COLOURS = ["#1f77b4", "#d62728", "#2ca02c", "#ff7f0e", "#9467bd", "#8c564b"]
+
+
+def _model_family(model: str) -> str:
+    return model.split("_")[0]  # "gemini_2" is Gemini's second attempt
+
+
+def _group_label(group: str) -> str:
+    return group.replace("_percent", "%")
+
+
+def _seconds(s: float) -> str:
+    return f"{s:.3g}s" if s < 100 else f"{s:.0f}s"
+
+
+def _cell(r: dict, marks: bool) -> str:
+    if r["status"] != "ok":
+        return f"{r['status']} after {_seconds(r['wall_s'])}"
+    if not marks:
+        return _seconds(r["wall_s"])
+    return f"{STATUS_MARK.get(r.get('verification'), '⚠️')} {_seconds(r['wall_s'])}"
+
+
+def latest_by_id(runs: list[dict]) -> dict[str, dict]:
+    latest = {}
+    for run in runs:
+        for r in run["results"]:
+            latest[r["id"]] = r
+    return latest
+
+
+def results_table(runs: list[dict], marks: bool = True) -> str:
+    """
+    The readme's model-by-difficulty table, filled in from the latest results.
+
+    With `marks=False` the cells hold times only. The public readme does not
+    say which solutions were correct, and verification marks would.
+    """
+    latest = latest_by_id(runs)
+    groups = sorted({i.split("/")[0] for i in latest if i.split("/")[0].endswith("_percent")},
+                    key=group_key)
+    lines = ["| Difficulty | " + " | ".join(name for _, name in MODELS) + " |",
+             "|------------|" + "|".join("-" * (len(name) + 2) for _, name in MODELS) + "|"]
+    for group in groups:
+        cells = []
+        for family, _ in MODELS:
+            found = [latest[i] for i in sorted(latest)
+                     if i.split("/")[0] == group and _model_family(i.split("/")[1]) == family]
+            cells.append(" / ".join(_cell(r, marks) for r in found) or "—")
+        lines.append(f"| **{_group_label(group)}** | " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+def svg_chart(series: dict[str, list[tuple[float, float]]], title: str, ylabel: str,
+              logx: bool = False, logy: bool = True, xticks: list[tuple[float, str]] | None = None,
+              width: int = 640, height: int = 320) -> str:
+    """A small line chart as standalone SVG: one polyline plus markers per series."""
+    left, right, top, bottom = 70, 150, 30, 50
+    pts = [(x, y) for s in series.values() for x, y in s
+           if (not logx or x > 0) and (not logy or y > 0)]
+    head = (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'font-family="sans-serif" font-size="11">'
+            f'<text x="{width / 2}" y="18" text-anchor="middle" font-size="13">'
+            f'{html.escape(title)}</text>')
+    if not pts:
+        return (head + f'<text x="{width / 2}" y="{height / 2}" text-anchor="middle">'
+                       'no data</text></svg>')
+
+    fx = (lambda v: math.log10(v)) if logx else (lambda v: v)
+    fy = (lambda v: math.log10(v)) if logy else (lambda v: v)
+    x0, x1 = min(fx(x) for x, _ in pts), max(fx(x) for x, _ in pts)
+    y0, y1 = min(fy(y) for _, y in pts), max(fy(y) for _, y in pts)
+    if x1 == x0:
+        x0, x1 = x0 - 1, x1 + 1
+    if y1 == y0:
+        y0, y1 = y0 - 1, y1 + 1
+    pw, ph = width - left - right, height - top - bottom
+
+    def px(x):
+        return left + (fx(x) - x0) / (x1 - x0) * pw
+
+    def py(y):
+        return top + ph - (fy(y) - y0) / (y1 - y0) * ph
+
+    out = [head, f'<rect x="{left}" y="{top}" width="{pw}" height="{ph}" '
+                 'fill="none" stroke="#999"/>']
+    for i in range(5):  # y grid: evenly spaced in plot units
+        v = y0 + (y1 - y0) * i / 4
+        y = top + ph - ph * i / 4
+        label = 10 ** v if logy else v
+        out.append(f'<line x1="{left}" x2="{left + pw}" y1="{y:.1f}" y2="{y:.1f}" stroke="#eee"/>'
+                   f'<text x="{left - 6}" y="{y + 4:.1f}" text-anchor="end">{label:.3g}</text>')
+    if xticks is None:
+        xticks = [(10 ** (x0 + (x1 - x0) * i / 4) if logx else x0 + (x1 - x0) * i / 4, None)
+                  for i in range(5)]
+    for x, label in xticks:
+        label = label if label is not None else f"{x:.3g}"
+        out.append(f'<text x="{px(x):.1f}" y="{top + ph + 16}" text-anchor="middle">'
+                   f'{html.escape(label)}</text>')
+    out.append(f'<text x="16" y="{top + ph / 2}" transform="rotate(-90 16 {top + ph / 2})" '
+               f'text-anchor="middle">{html.escape(ylabel)}</text>')
+
+    for i, (name, s) in enumerate(series.items()):
+        colour = _COLOURS[i % len(_COLOURS)]
+        s = [(x, y) for x, y in s if (not logx or x > 0) and (not logy or y > 0)]
+        coords = " ".join(f"{px(x):.1f},{py(y):.1f}" for x, y in s)
+        if len(s) > 1:
+            out.append(f'<polyline points="{coords}" fill="none" stroke="{colour}" '
+                       'stroke-width="1.5"/>')
+        out.extend(f'<circle cx="{px(x):.1f}" cy="{py(y):.1f}" r="2.5" fill="{colour}"/>'
+                   for x, y in s)
+        ly = top + 12 + 16 * i
+        out.append(f'<rect x="{left + pw + 12}" y="{ly - 8}" width="10" height="10" '
+                   f'fill="{colour}"/><text x="{left + pw + 28}" y="{ly + 1}">'
+                   f'{html.escape(name)}</text>')
+    out.append("</svg>")
+    return "".join(out)
+
+
+def trend_charts(group: str, runs: list[dict]) -> tuple[str, str] | None:
+    """(runtime SVG, memory SVG) across the runs that include `group`, or None."""
+    relevant = [run for run in runs if any(r["id"].startswith(group + "/") for r in run["results"])]
+    if not relevant:
+        return None
+    wall: dict[str, list] = {}
+    rss: dict[str, list] = {}
+    for x, run in enumerate(relevant):
+        for r in run["results"]:
+            if r["id"].startswith(group + "/") and r["status"] == "ok":
+                model = r["id"].split("/")[1]
+                wall.setdefault(model, []).append((x, r["wall_s"]))
+                rss.setdefault(model, []).append((x, r["peak_rss_kb"] / 1024))
+    ticks = [(x, (run["meta"].get("commit") or "?")[:7]) for x, run in enumerate(relevant)]
+    step = max(1, len(ticks) // 8)  # keep the commit labels readable
+    ticks = ticks[::step]
+    label = _group_label(group)
+    return (svg_chart(dict(sorted(wall.items())), f"{label}: wall time per run", "seconds",
+                      xticks=ticks),
+            svg_chart(dict(sorted(rss.items())), f"{label}: peak RSS per run", "MB",
+                      xticks=ticks))
+
+
+def scaling_chart(group: str, scaling_runs: list[dict]) -> str | None:
+    """Latest scaling sweep of each model in `group`, with its fitted exponent."""
+    latest = {}
+    for run in scaling_runs:
+        for r in run["results"]:
+            if r["id"].startswith(group + "/"):
+                latest[r["id"]] = r
+    if not latest:
+        return None
+    series = {}
+    for i in sorted(latest):
+        r = latest[i]
+        k = "" if r.get("exponent") is None else f" (k={r['exponent']:.2f})"
+        series[i.split("/")[1] + k] = [(p["size"], p["net_s"]) for p in r["points"]
+                                       if p["status"] == "ok"]
+    return svg_chart(series, f"{_group_label(group)}: scaling (net of startup)", "seconds",
+                     logx=True)
+
+
+def build(out_dir: Path = DEFAULT_OUT_DIR) -> Path:
+    """Render the report into `<out_dir>/report/`; returns the HTML path."""
+    runs = sorted(load_runs(out_dir, "runs"), key=lambda run: run["meta"].get("started_at", ""))
+    scaling = sorted(load_runs(out_dir, "scaling"),
+                     key=lambda run: run["meta"].get("started_at", ""))
+    dest = Path(out_dir) / "report"
+    dest.mkdir(parents=True, exist_ok=True)
+
+    groups = sorted({r["id"].split("/")[0] for run in runs + scaling for r in run["results"]},
+                    key=group_key)
+    table = results_table(runs)
+    last = runs[-1]["meta"] if runs else {}
+    source = (f"{len(runs)} recorded run(s) and {len(scaling)} scaling sweep(s); latest run "
+              f"{last.get('started_at', '-')} at commit {(last.get('commit') or '-')[:8]} "
+              f"on {last.get('implementation', '')} {last.get('python', '')}")
+
+    md = ["# Benchmark report", "", source, "", "## Results", "", table, "", LEGEND, ""]
+    body = [f"<h1>Benchmark report</h1><p>{html.escape(source)}</p><h2>Results</h2>",
+            _markdown_table_to_html(table), f"<p>{html.escape(LEGEND)}</p>"]
+    for group in groups:
+        charts = []
+        trends = trend_charts(group, runs)
+        if trends:
+            charts += [("runtime", trends[0]), ("memory", trends[1])]
+        curve = scaling_chart(group, scaling)
+        if curve:
+            charts.append(("scaling", curve))
+        md += [f"## {_group_label(group)}", ""]
+        body.append(f"<h2>{html.escape(_group_label(group))}</h2>")
+        for kind, svg in charts:
+            name = f"{group}_{kind}.svg"
+            (dest / name).write_text(svg + "\n")
+            md += [f"![{group} {kind}]({name})", ""]
+            body.append(f"<div>{svg}</div>")
+
+    (dest / "README.md").write_text("\n".join(md))
+    page = dest / "index.html"
+    page.write_text("<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+                    "<title>Benchmark report</title><style>"
+                    "body{font-family:sans-serif;max-width:960px;margin:auto}"
+                    "table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:4px 8px}"
+                    "</style></head><body>" + "".join(body) + "</body></html>\n")
+    return page
+
+
+def _markdown_table_to_html(table: str) -> str:
+    rows = [line.strip("|").split("|") for line in table.splitlines()]
+    head, body = rows[0], rows[2:]
+    out = ["<table><tr>", *(f"<th>{html.escape(c.strip())}</th>" for c in head), "</tr>"]
+    for row in body:
+        cells = [html.escape(c.strip().strip("*")) for c in row]
+        out += ["<tr>", *(f"<td>{c}</td>" for c in cells), "</tr>"]
+    out.append("</table>")
+    return "".join(out)
+
+
+def update_readme(readme: Path, out_dir: Path = DEFAULT_OUT_DIR) -> None:
+    """
+    Replace (or append) the measured-results section of `benchmarking/readme.md`.
+
+    The section gives times only, without verification marks.
+    """
+    section = (f"{README_START}\n### Measured runtimes\n\n"
+               f"Generated by `python -m harness report --readme` from the latest recorded run.\n\n"
+               f"{results_table(load_runs(out_dir, 'runs'), marks=False)}\n{README_END}")
+    text = readme.read_text()
+    if README_START in text and README_END in text:
+        before, rest = text.split(README_START, 1)
+        text = before + section + rest.split(README_END, 1)[1]
+    else:
+        text = text.rstrip("\n") + "\n\n" + section + "\n"
+    readme.write_text(text)
@@ -0,0 +1,113 @@
+"""Persist benchmark runs as JSON (full record) and CSV (flat table)."""
+
+from __future__ import annotations
+
+import csv
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from harness.discover import REPO_ROOT
+
+DEFAULT_OUT_DIR = REPO_ROOT / "benchmarking" / "results"
+
+CSV_FIELDS = [
+    "id", "path", "status", "exit_code", "wall_s", "cpu_s", "peak_rss_kb",
+    "answer", "verification", "answer_line", "args", "repeat", "wall_iqr_s", "cached",
+]
+
+SCALING_CSV_FIELDS = ["id", "size", "status", "wall_s", "net_s", "exponent"]
+
+DIFF_CSV_FIELDS = ["group", "size", "model", "params", "answer", "time_s", "agrees", "ratio",
+                   "error"]
+
+INPROCESS_CSV_FIELDS = ["id", "params", "warmup", "repeat", "min_s", "median_s", "answer",
+                        "verification"]
+
+
+def git_commit(root: Path = REPO_ROOT) -> str | None:
+    """Current commit hash, or None outside a git checkout."""
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=root, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_metadata() -> dict:
+    """Context needed to compare one run with another."""
+    return {
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "executable": sys.executable,
+    }
+
+
+def write_run(results: list[dict], meta: dict, out_dir: Path = DEFAULT_OUT_DIR,
+              kind: str = "runs", rows: list[dict] | None = None,
+              fields: list[str] = CSV_FIELDS) -> tuple[Path, Path]:
+    """
+    Write one run to `<out_dir>/<kind>/<timestamp>_<commit>.{json,csv}`.
+
+    Every run gets its own pair of files so that history accumulates and runs
+    can be compared later. The JSON holds `results` as given; the CSV holds
+    `rows` (default: `results`) restricted to `fields`. Returns the two paths.
+    """
+    runs = Path(out_dir) / kind
+    runs.mkdir(parents=True, exist_ok=True)
+    stamp = time.strftime("%Y%m%dT%H%M%S")
+    commit = (meta.get("commit") or "nocommit")[:8]
+    stem = runs / f"{stamp}_{commit}"
+    n = 1
+    while stem.with_suffix(".json").exists():  # two runs within the same second
+        stem = runs / f"{stamp}_{commit}_{n}"
+        n += 1
+
+    json_path = stem.with_suffix(".json")
+    with open(json_path, "w") as fh:
+        json.dump({"meta": meta, "results": results}, fh, indent=2)
+        fh.write("\n")
+
+    csv_path = stem.with_suffix(".csv")
+    with open(csv_path, "w", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        for row in (results if rows is None else rows):
+            row = dict(row)
+            if isinstance(row.get("args"), list):
+                row["args"] = " ".join(row["args"])
+            if isinstance(row.get("params"), dict):
+                row["params"] = json.dumps(row["params"])
+            writer.writerow(row)
+
+    return json_path, csv_path
+
+
+def load_runs(out_dir: Path = DEFAULT_OUT_DIR, kind: str = "runs") -> list[dict]:
+    """All recorded runs of `kind` under `out_dir`, oldest first."""
+    runs = Path(out_dir) / kind
+    if not runs.is_dir():
+        return []
+    loaded = []
+    for path in sorted(runs.glob("*.json")):
+        with open(path) as fh:
+            loaded.append(json.load(fh))
+    return loaded
+
+
+def latest_results(out_dir: Path = DEFAULT_OUT_DIR, kind: str = "runs") -> dict[str, dict]:
+    """The most recent recorded result for each solution id, across all runs of `kind`."""
+    latest = {}
+    for run in load_runs(out_dir, kind):
+        for r in run["results"]:
+            latest[r["id"]] = r
+    return latest
@@ -0,0 +1,222 @@
+"""Run one solution script in an isolated subprocess and measure it."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from harness.discover import REPO_ROOT, Solution
+
+LAUNCHER = Path(__file__).with_name("_launch.py")  # pins and caps, then execs the solution
+DEFAULT_TIMEOUT = 300.0  # seconds; the prompts gave the models a 5-minute budget
+
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?")
+
+
+@dataclass
+class RunResult:
+    """Measurements from a single subprocess run of a solution."""
+
+    id: str
+    path: str
+    status: str  # "ok", "error", "timeout" or "memory" (ran out under `memory_limit_mb`)
+    exit_code: int | None
+    wall_s: float
+    cpu_s: float
+    peak_rss_kb: int
+    answer_line: str | None  # last non-empty line printed to stdout
+    answer: str | None  # last number on that line, if any
+    args: list[str] = field(default_factory=list)
+    params: dict = field(default_factory=dict)
+    stderr_tail: str = ""
+    verification: str | None = None  # set by harness.answers.verify
+    memory_limit_mb: int | None = None
+    rss_samples: list[tuple[float, int]] = field(default_factory=list)  # (seconds, RSS kB)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def extract_answer(stdout: str, answer_re: str | None = None) -> tuple[str | None, str | None]:
+    """
+    Return (answer line, answer).
+
+    By default the answer line is the last non-empty line of stdout and the
+    answer is the last number on it. With `answer_re`, the answer is group 1 of
+    the regex's last match (searched line by line) instead.
+    """
+    lines = [line.strip() for line in stdout.splitlines() if line.strip()]
+    if not lines:
+        return None, None
+    if answer_re is not None:
+        pattern = re.compile(answer_re)
+        for line in reversed(lines):
+            matches = list(pattern.finditer(line))
+            if matches:
+                return line, matches[-1].group(1)
+        return lines[-1], None
+    last = lines[-1]
+    numbers = _NUMBER.findall(last)
+    return last, (numbers[-1] if numbers else None)
+
+
+class _RssSampler(threading.Thread):
+    """
+    Record a process's resident set size over time from /proc/<pid>/statm.
+
+    Sampling starts every `interval` seconds. Once `max_samples` are held, every
+    other sample is dropped and the interval doubles, so long runs keep a bounded,
+    evenly spaced trace. Only the main process is sampled, not its children.
+    """
+
+    def __init__(self, pid: int, interval: float = 0.1, max_samples: int = 512):
+        super().__init__(daemon=True)
+        self.path = f"/proc/{pid}/statm"
+        self.interval = interval
+        self.max_samples = max_samples
+        self.samples: list[tuple[float, int]] = []
+        self.stop = threading.Event()
+        self.page_kb = os.sysconf("SC_PAGE_SIZE") // 1024
+
+    def run(self):
+        start = time.perf_counter()
+        while True:
+            try:
+                with open(self.path) as fh:
+                    rss = int(fh.read().split()[1]) * self.page_kb
+            except (OSError, IndexError, ValueError):
+                return  # gone, or no /proc on this platform
+            if rss:  # an exited, not yet reaped process reads as zero
+                self.samples.append((round(time.perf_counter() - start, 3), rss))
+            if len(self.samples) >= self.max_samples:
+                self.samples = self.samples[::2]
+                self.interval *= 2
+            if self.stop.wait(self.interval):
+                return
+
+
+def _kill_group(pid: int) -> None:
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def run_solution(solution: Solution, timeout: float = DEFAULT_TIMEOUT, params: dict | None = None,
+                 answer_re: str | None = None, profile_dir: Path | None = None,
+                 cpu: int | None = None, memory_limit_mb: int | None = None) -> RunResult:
+    """
+    Execute `solution` as `python <script> [params...]` and wait for it.
+
+    `params` are passed as positional arguments in dict order; without them the
+    script solves its default (target) size. The script runs in its own
+    session so that a timeout kills everything it spawned. CPU time and peak
+    RSS come from `wait4`, which reports resource usage for exactly this child
+    rather than all children of the harness.
+
+    With `profile_dir`, the subprocess is `python -m harness.profiling` instead,
+    which calls `solve(**params)` under cProfile and tracemalloc, writes its
+    reports under `profile_dir` and prints the returned answer last.
+
+    With `cpu`, the child is pinned to that core before the solution starts,
+    so the whole run is pinned; it passes the pinning on to anything it spawns.
+
+    With `memory_limit_mb`, the child's address space (RLIMIT_AS) is capped,
+    also before the solution starts. An allocation past the cap fails, and the run
+    gets status "memory". The cap counts virtual memory, which is usually a
+    good deal more than RSS, so leave some headroom. Resident memory is sampled
+    over time into `rss_samples`.
+    """
+    params = dict(params or {})
+    args = [str(v) for v in params.values()]
+    if profile_dir is None:
+        command = [sys.executable, str(solution.path), *args]
+    else:
+        command = [sys.executable, "-m", "harness.profiling", solution.id, str(profile_dir),
+                   json.dumps(params)]
+        answer_re = None
+    if cpu is not None or memory_limit_mb is not None:
+        # set up by a launcher that execs the command: a preexec_fn could
+        # deadlock in the fork of this threaded process
+        limits = [*(["--cpu", str(cpu)] if cpu is not None else []),
+                  *(["--as-mb", str(memory_limit_mb)] if memory_limit_mb is not None else [])]
+        command = [sys.executable, str(LAUNCHER), *limits, "--", *command]
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            command,
+            cwd=solution.path.parent,
+            stdin=subprocess.DEVNULL,
+            stdout=out,
+            stderr=err,
+            env=env,
+            start_new_session=True,
+        )
+        sampler = _RssSampler(proc.pid)
+        sampler.start()
+        timed_out = threading.Event()
+
+        def on_timeout():
+            timed_out.set()
+            _kill_group(proc.pid)
+
+        timer = threading.Timer(timeout, on_timeout)
+        timer.start()
+        try:
+            _, wait_status, usage = os.wait4(proc.pid, 0)
+        finally:
+            timer.cancel()
+            sampler.stop.set()
+        wall = time.perf_counter() - start
+        sampler.join()
+        exit_code = os.waitstatus_to_exitcode(wait_status)
+        proc.returncode = exit_code  # keep Popen from reaping the pid again
+
+        out.seek(0)
+        err.seek(0)
+        stdout = out.read().decode(errors="replace")
+        stderr = err.read().decode(errors="replace")
+
+    if timed_out.is_set():
+        status = "timeout"
+    elif exit_code == 0:
+        status = "ok"
+    elif memory_limit_mb is not None and ("MemoryError" in stderr or exit_code < 0
+                                          or "failed to map segment" in stderr):
+        # a MemoryError, a C extension killed by a failed malloc, or a shared
+        # library that no longer fits when the interpreter imports it
+        status = "memory"
+    else:
+        status = "error"
+
+    answer_line, answer = extract_answer(stdout, answer_re)
+    return RunResult(
+        id=solution.id,
+        path=solution.relpath,
+        status=status,
+        exit_code=None if status == "timeout" else exit_code,
+        wall_s=round(wall, 6),
+        cpu_s=round(usage.ru_utime + usage.ru_stime, 6),
+        # Kilobytes on Linux. The kernel counts the pre-exec fork too, so this
+        # never reads below the harness's own footprint (~15MB).
+        peak_rss_kb=usage.ru_maxrss,
+        answer_line=answer_line,
+        answer=answer,
+        args=args,
+        params=params,
+        stderr_tail="\n".join(stderr.strip().splitlines()[-5:]),
+        memory_limit_mb=memory_limit_mb,
+        rss_samples=sampler.samples,
+    )
@@ -0,0 +1,85 @@
+"""
+Scaling-curve benchmark: time each solution over a geometric sweep of sizes and
+fit an empirical complexity exponent, t(n) ~ c * n^k.
+"""
+
+from __future__ import annotations
+
+import math
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+
+from harness.discover import Solution
+from harness.runner import DEFAULT_TIMEOUT, run_solution
+from harness.specs import Spec
+
+# Points whose time above interpreter startup is below this are mostly noise
+# and are left out of the fit.
+MIN_FIT_SECONDS = 0.05
+
+
+@dataclass
+class ScalingResult:
+    id: str
+    target: int
+    points: list[dict] = field(default_factory=list)  # {size, params, status, wall_s, net_s}
+    exponent: float | None = None  # fitted k in t ~ c * n^k
+    coefficient: float | None = None  # fitted c
+    predicted_target_s: float | None = None
+    predicted_10x_s: float | None = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def startup_seconds(repeat: int = 5) -> float:
+    """Median wall time of a bare interpreter start, subtracted from every point."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def fit_power_law(points: list[tuple[int, float]]) -> tuple[float, float] | None:
+    """Least-squares fit of log t = log c + k log n; returns (k, c) or None."""
+    pts = [(n, t) for n, t in points if n > 0 and t >= MIN_FIT_SECONDS]
+    if len(pts) < 2 or len({n for n, _ in pts}) < 2:
+        return None
+    xs = [math.log(n) for n, _ in pts]
+    ys = [math.log(t) for _, t in pts]
+    slope, intercept = statistics.linear_regression(xs, ys)
+    return slope, math.exp(intercept)
+
+
+def sweep(solution: Solution, spec: Spec, timeout: float = DEFAULT_TIMEOUT,
+          factor: float | None = None, budget: float | None = None,
+          startup: float = 0.0) -> ScalingResult:
+    """
+    Run `solution` at each size of the spec's sweep, smallest first.
+
+    The sweep stops early once a point fails, times out, or takes longer than
+    `budget` seconds, since larger sizes would only be slower.
+    """
+    result = ScalingResult(id=solution.id, target=spec.target)
+    for size in spec.sizes(factor):
+        params = spec.scale(size)
+        r = run_solution(solution, timeout=timeout, params=params, answer_re=spec.answer_re)
+        net = max(r.wall_s - startup, 0.0)
+        result.points.append({"size": size, "params": params, "status": r.status,
+                              "wall_s": r.wall_s, "net_s": round(net, 6)})
+        if r.status != "ok" or (budget is not None and r.wall_s > budget):
+            break
+
+    fit = fit_power_law([(p["size"], p["net_s"]) for p in result.points if p["status"] == "ok"])
+    if fit is not None:
+        k, c = fit
+        result.exponent = round(k, 3)
+        result.coefficient = c
+        result.predicted_target_s = round(startup + c * spec.target ** k, 3)
+        result.predicted_10x_s = round(startup + c * (10 * spec.target) ** k, 3)
+    return result
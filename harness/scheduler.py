@@ -0,0 +1,154 @@
+"""
+Run many solutions at once without letting them disturb each other's timings.
+
+Each worker thread owns one CPU core and pins every subprocess it starts to
+that core, so two solutions never compete for the same core. Concurrency is
+also limited by memory: a job is only started while the expected peak RSS of
+everything in flight, taken from the previous recorded run, fits in the memory
+budget. Jobs that do not fit wait, except that one job may always run alone.
+Jobs run longest-first, using the previous run's wall time, so the slowest
+solution does not start last.
+
+A job that finishes in under `short_s` seconds is run `repeat` times in total,
+and is summarised by the median and interquartile range of its wall times.
+Single runs of fast scripts are mostly noise. Long jobs run once.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable
+
+from harness.discover import Solution
+from harness.runner import DEFAULT_TIMEOUT, RunResult, run_solution
+
+DEFAULT_MEMORY_KB = 256 * 1024  # assumed peak RSS of a solution with no recorded run
+DEFAULT_SHORT_S = 10.0
+MEMORY_HEADROOM = 0.8  # fraction of available memory the jobs may use together
+
+
+@dataclass
+class Job:
+    solution: Solution
+    params: dict | None = None
+    answer_re: str | None = None
+    memory_kb: int = DEFAULT_MEMORY_KB  # expected peak RSS
+    expected_s: float | None = None  # wall time of the previous run, if any
+
+
+def available_memory_kb() -> int:
+    """MemAvailable from /proc/meminfo, or physical memory where that is missing."""
+    try:
+        with open("/proc/meminfo") as fh:
+            for line in fh:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // 1024
+
+
+def usable_cores() -> list[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def summarize(samples: list[RunResult]) -> dict:
+    """
+    One result dict for all samples of a solution.
+
+    Fields come from the sample with the median wall time, and `wall_s` and
+    `cpu_s` are replaced by the medians. A failed sample takes precedence
+    because the failure is the interesting part. `peak_rss_kb` is the maximum
+    over all samples.
+    """
+    failed = [r for r in samples if r.status != "ok"]
+    walls = sorted(r.wall_s for r in samples)
+    chosen = failed[0] if failed else min(
+        samples, key=lambda r: abs(r.wall_s - statistics.median(walls)))
+    d = chosen.to_dict()
+    iqr = 0.0
+    if len(walls) >= 2:
+        q1, _, q3 = statistics.quantiles(walls, n=4, method="inclusive")
+        iqr = q3 - q1
+    d.update(
+        wall_s=round(statistics.median(walls), 6),
+        cpu_s=round(statistics.median(r.cpu_s for r in samples), 6),
+        peak_rss_kb=max(r.peak_rss_kb for r in samples),
+        repeat=len(samples),
+        wall_samples_s=[r.wall_s for r in samples],
+        wall_iqr_s=round(iqr, 6),
+    )
+    return d
+
+
+def run_jobs(jobs: list[Job], workers: int = 1, memory_budget_kb: int | None = None,
+             repeat: int = 1, short_s: float = DEFAULT_SHORT_S,
+             timeout: float = DEFAULT_TIMEOUT, pin: bool = True, profile_dir=None,
+             memory_limit_mb: int | None = None,
+             on_sample: Callable[[RunResult], None] | None = None) -> dict[str, list[RunResult]]:
+    """
+    Run `jobs` on up to `workers` cores. Returns every sample, keyed by solution id.
+
+    `on_sample` is called from the worker threads (under a lock) as each
+    sample completes.
+    """
+    cores = usable_cores()
+    workers = max(1, min(workers, len(cores), len(jobs) or 1))
+    if memory_budget_kb is None:
+        memory_budget_kb = int(available_memory_kb() * MEMORY_HEADROOM)
+
+    # Unknown durations first (they might be long), then longest first.
+    pending = deque(sorted(jobs, key=lambda j: -(j.expected_s if j.expected_s is not None
+                                                 else float("inf"))))
+    samples: dict[str, list[RunResult]] = {j.solution.id: [] for j in jobs}
+    cond = threading.Condition()
+    state = {"memory_kb": 0, "active": 0}
+
+    def take() -> Job | None:
+        # Called with `cond` held; blocks until a job fits or nothing is left.
+        while True:
+            for job in pending:
+                if state["active"] == 0 or state["memory_kb"] + job.memory_kb <= memory_budget_kb:
+                    pending.remove(job)
+                    state["memory_kb"] += job.memory_kb
+                    state["active"] += 1
+                    return job
+            if not pending and state["active"] == 0:
+                return None
+            cond.wait()
+
+    def worker(core: int | None):
+        while True:
+            with cond:
+                job = take()
+            if job is None:
+                return
+            r = run_solution(job.solution, timeout=timeout, params=job.params,
+                             answer_re=job.answer_re, cpu=core, profile_dir=profile_dir,
+                             memory_limit_mb=memory_limit_mb)
+            with cond:
+                state["memory_kb"] -= job.memory_kb
+                state["active"] -= 1
+                runs = samples[job.solution.id]
+                runs.append(r)
+                if (len(runs) == 1 and repeat > 1 and r.status == "ok" and r.wall_s < short_s):
+                    more = Job(job.solution, job.params, job.answer_re,
+                               memory_kb=max(job.memory_kb, r.peak_rss_kb), expected_s=r.wall_s)
+                    pending.extend([more] * (repeat - 1))
+                if on_sample is not None:
+                    on_sample(r)
+                cond.notify_all()
+
+    threads = [threading.Thread(target=worker, args=(cores[i] if pin else None,), daemon=True)
+               for i in range(workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return samples
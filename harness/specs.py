@@ -0,0 +1,133 @@
+"""
+Problem-size parameters for each solution.
+
+Every solution script accepts its size parameter(s) as positional command-line
+arguments, in the order given by `Spec.scale`, and falls back to the problem's
+target size when run without arguments. A spec says how to build those
+parameters from a single integer "size" so that the scaling benchmark can sweep
+sizes geometrically and compare them against the target.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass(frozen=True)
+class Spec:
+    target: int  # size of the actual Project Euler query
+    scale: Callable[[int], dict]  # size -> {param: value}, in argv order
+    lo: int  # smallest size in the scaling sweep
+    hi: int  # largest size in the scaling sweep
+    factor: float = 2.0  # geometric step between sweep sizes
+    params: dict | None = None  # target parameters, if not simply scale(target)
+    # Whether running at the target parameters claims to answer the actual
+    # Project Euler query (false for exploratory scripts that stop short of it).
+    answers_target: bool = True
+    # Regex whose last match (group 1) in stdout is the answer, for scripts
+    # that print more text after it. Default: last number on the last line.
+    answer_re: str | None = None
+    # Whether a public check runs at scale(size) instead of the target
+    # parameters with the size replaced, for targets that fix other parameters.
+    scale_checks: bool = False
+
+    @property
+    def target_params(self) -> dict:
+        return self.params if self.params is not None else self.scale(self.target)
+
+    def check_params(self, check: dict) -> dict | None:
+        """Parameters to run a public check with, or None if it names a parameter we lack."""
+        names = {k.lower(): k for k in self.target_params}
+        if not all(k.lower() in names for k in check):
+            return None
+        params = dict(self.target_params)
+        params.update({names[k.lower()]: v for k, v in check.items()})
+        if self.scale_checks and len(check) == 1:
+            params = self.scale(next(iter(check.values())))
+        return params
+
+    def sizes(self, factor: float | None = None) -> list[int]:
+        """Integer sizes lo, lo*f, lo*f^2, ... up to hi (inclusive, deduplicated)."""
+        factor = factor or self.factor
+        sizes, x = [], float(self.lo)
+        while round(x) <= self.hi:
+            n = int(round(x))
+            if not sizes or n > sizes[-1]:
+                sizes.append(n)
+            x *= factor
+        return sizes
+
+
+def _one(name: str) -> Callable[[int], dict]:
+    return lambda n: {name: n}
+
+
+def _red_black(n: int) -> dict:
+    # P(R, B) at the target has R = 2B
+    return {"R": 2 * n, "B": n}
+
+
+def _hybrid_prime_limit(n: int) -> dict:
+    # test_case_easy/solution_gemini.py hardcodes a 16M sieve for n = 800800;
+    # scale it with the same log(n^n)/log(2) bound the other models use.
+    return {"n": n, "prime_limit": int(n * math.log(n) / math.log(2)) + 1}
+
+
+SPECS: dict[str, Spec] = {
+    "5_percent/chat": Spec(12345, _red_black, 10**3, 10**7, factor=10),
+    "5_percent/claude": Spec(12345, _red_black, 16, 1024),
+    "5_percent/gemini": Spec(12345, _red_black, 32, 1024),
+
+    "10_percent/chat": Spec(12, _one("k"), 3, 1000, factor=1.4),
+    "10_percent/claude": Spec(12, _one("k"), 3, 10, factor=1.4,
+                              answer_re=r"^S\(\d+\) = (\d+)$"),
+    "10_percent/gemini": Spec(12, _one("k"), 3, 12, factor=1.4),
+
+    "20_percent/chat": Spec(10**18, _one("N"), 10**3, 10**18, factor=1000),
+    "20_percent/claude": Spec(1000, _one("limit"), 16, 1000),
+    "20_percent/gemini": Spec(10**18, _one("N"), 10**3, 10**18, factor=1000),
+
+    "30_percent/chat": Spec(10**7, _one("N"), 10**4, 10**6),
+    "30_percent/claude": Spec(10**7, _one("N"), 10**4, 10**6),
+    "30_percent/gemini": Spec(10**7, _one("N"), 10**4, 10**6),
+
+    "40_percent/chat": Spec(10**6, _one("n"), 10**4, 10**6),
+    "40_percent/gemini": Spec(10**6, _one("N"), 10**4, 10**6, factor=10),
+    "40_percent/gemini_2": Spec(10**6, _one("N"), 10**3, 10**5),
+
+    "50_percent/chat": Spec(18, _one("K"), 2, 12, factor=1.5),
+    "50_percent/gemini": Spec(18, _one("K"), 2, 12, factor=1.5),
+    "50_percent/gemini_2": Spec(18, _one("K"), 2, 12, factor=1.5),
+
+    "60_percent/chat": Spec(10**7, _one("N"), 10**4, 10**6),
+    "60_percent/gemini": Spec(10**7, _one("N"), 10**4, 10**6),
+
+    "70_percent/chat": Spec(62, _one("r"), 4, 62),
+
+    "80_percent/chat": Spec(100, _one("N"), 10, 80, factor=1.5),
+
+    "90_percent/chat": Spec(6, _one("n"), 3, 6, factor=1.2, answers_target=False),
+
+    "100_percent/chat": Spec(10_000, _one("n"), 100, 3200),
+
+    "test_case_easy/chat": Spec(800_800, _one("n"), 1000, 128_000),
+    "test_case_easy/claude": Spec(800_800, _one("n"), 1000, 16_000,
+                                  answer_re=r"^C\(\d+\^\d+\) = (\d+)$"),
+    "test_case_easy/gemini": Spec(800_800, _hybrid_prime_limit, 1000, 128_000,
+                                  params={"n": 800_800, "prime_limit": 16_000_000},
+                                  scale_checks=True),  # its target sieve is 16M wide
+    "test_case_easy/hybrid": Spec(800_800, _one("n"), 1000, 128_000),
+
+    "test_case_hard/chat": Spec(10**8, _one("n"), 10**3, 10**8, factor=10),
+    "test_case_hard/claude": Spec(100_000, _one("n"), 10, 160, answers_target=False,
+                                  answer_re=r"≡ (\d+) \(mod"),
+    "test_case_hard/gemini": Spec(10**8, _one("N"), 10**4, 10**8, factor=10,
+                                  answer_re=r"is: (\d+)$"),
+}
+
+
+def spec_for(solution_id: str) -> Spec | None:
+    return SPECS.get(solution_id)
+
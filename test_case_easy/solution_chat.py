@@ -1,21 +1,14 @@
 import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))  # repo root
+from eulerlib.sieve import primes_upto
 
 # -------- prime generation: odd-only sieve (memory & speed friendly) --------
 def sieve_primes_upto(n: int):
     """Return list of all primes <= n using an odd-only sieve."""
-    if n < 2:
-        return []
-    # Number of odd integers in [3..n]
-    size = (n - 1) // 2
-    sieve = bytearray(b'\x01') * size
-    limit = int(math.isqrt(n))
-    # index i corresponds to number p = 2*i + 3
-    for i in range((limit - 1)//2 + 1):
-        if sieve[i]:
-            p = 2*i + 3
-            start = (p*p - 3)//2
-            sieve[start::p] = b'\x00' * ((size - start - 1)//p + 1)
-    return [2] + [2*i + 3 for i in range(size) if sieve[i]]
+    return primes_upto(n).tolist()
 
 # -------- core counting in log-space with a two-pointer sweep --------
 def count_hybrids_with_logL(L: float) -> int:
@@ -54,11 +47,16 @@ def C_power(base: int, exp: int) -> int:
     """C(base^exp) without constructing the huge number: uses exp*ln(base)."""
     return count_hybrids_with_logL(exp * math.log(base))
 
+def solve(n: int = 800_800) -> int:
+    """C(n^n), the problem's target being n = 800800."""
+    return C_power(n, n)
+
 if __name__ == "__main__":
     # Given checks
     print("C(800) =", C_upto(800))                       # expected 2
     print("C(800^800) =", C_power(800, 800))             # expected 10790
 
     # The target
-    ans = C_power(800_800, 800_800)
-    print("C(800800^800800) =", ans)
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 800_800
+    ans = solve(n)
+    print(f"C({n}^{n}) =", ans)
@@ -1,20 +1,14 @@
 import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))  # repo root
+from eulerlib.sieve import primes_upto
 
 
 def sieve_of_eratosthenes(limit):
     """Generate all primes up to limit using the Sieve of Eratosthenes."""
-    if limit < 2:
-        return []
-
-    is_prime = [True] * (limit + 1)
-    is_prime[0] = is_prime[1] = False
-
-    for i in range(2, int(math.sqrt(limit)) + 1):
-        if is_prime[i]:
-            for j in range(i * i, limit + 1, i):
-                is_prime[j] = False
-
-    return [i for i, prime in enumerate(is_prime) if prime]
+    return primes_upto(limit).tolist()
 
 
 def count_hybrid_integers(n):
@@ -83,32 +77,39 @@ def count_hybrid_integers_exact(n):
     return count
 
 
-# Verify the given examples
-print("Verification:")
-print(f"C(800) = {count_hybrid_integers_exact(800)} (expected: 2)")
-
-# For 800^800, use logarithmic approach
-n_medium = 800 ** 800
-print(f"C(800^800) = {count_hybrid_integers(n_medium)} (expected: 10790)")
-
-# Solve the main problem
-print("\nMain problem:")
-# 800800^800800 is enormous, use logarithmic approach
-n_large = 800800 ** 800800  # Python handles this symbolically
-result = count_hybrid_integers(n_large)
-print(f"C(800800^800800) = {result}")
-
-# Let's also show what the first few hybrid-integers are for understanding
-print("\nFirst few hybrid-integers:")
-small_hybrids = []
-primes = sieve_of_eratosthenes(100)
-for i in range(len(primes)):
-    for j in range(i + 1, len(primes)):
-        p, q = primes[i], primes[j]
-        hybrid = (p ** q) * (q ** p)
-        if hybrid <= 10000:
-            small_hybrids.append((hybrid, p, q))
-
-small_hybrids.sort()
-for h, p, q in small_hybrids[:10]:
-    print(f"{h} = {p}^{q} * {q}^{p}")
\ No newline at end of file
+def solve(n=800800):
+    """C(n^n), the problem's target being n = 800800."""
+    n_large = n ** n  # Python handles this symbolically
+    return count_hybrid_integers(n_large)
+
+
+if __name__ == "__main__":
+    # Verify the given examples
+    print("Verification:")
+    print(f"C(800) = {count_hybrid_integers_exact(800)} (expected: 2)")
+
+    # For 800^800, use logarithmic approach
+    n_medium = 800 ** 800
+    print(f"C(800^800) = {count_hybrid_integers(n_medium)} (expected: 10790)")
+
+    # Solve the main problem
+    print("\nMain problem:")
+    # 800800^800800 is enormous, use logarithmic approach
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 800800
+    result = solve(n)
+    print(f"C({n}^{n}) = {result}")
+
+    # Let's also show what the first few hybrid-integers are for understanding
+    print("\nFirst few hybrid-integers:")
+    small_hybrids = []
+    primes = sieve_of_eratosthenes(100)
+    for i in range(len(primes)):
+        for j in range(i + 1, len(primes)):
+            p, q = primes[i], primes[j]
+            hybrid = (p ** q) * (q ** p)
+            if hybrid <= 10000:
+                small_hybrids.append((hybrid, p, q))
+
+    small_hybrids.sort()
+    for h, p, q in small_hybrids[:10]:
+        print(f"{h} = {p}^{q} * {q}^{p}")
@@ -1,6 +1,11 @@
 import math
+import os
+import sys
 
-def solve_euler_problem():
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))  # repo root
+from eulerlib.sieve import primes_upto
+
+def solve_euler_problem(n=800800, prime_limit=16000000):
     """
     Solves the Euler problem to find C(800800^800800).
 
@@ -13,8 +18,8 @@ def solve_euler_problem():
     """
 
     # Define the constants from the problem.
-    base = 800800
-    exponent = 800800
+    base = n
+    exponent = n
 
     # Calculate the natural logarithm of n = base^exponent.
     # log(n) = exponent * log(base)
@@ -25,18 +30,10 @@ def solve_euler_problem():
     # The inequality becomes q*log(2) + 2*log(q) <= log_n.
     # For large q, q*log(2) dominates, so q is approximately log_n / log(2).
     # This gives q ~ 1.57e7. We'll use a safe upper bound.
-    prime_limit = 16000000
 
     # Step 1: Generate primes using a Sieve of Eratosthenes.
     print(f"Generating primes up to {prime_limit}...")
-    is_prime = [True] * (prime_limit + 1)
-    is_prime[0] = is_prime[1] = False
-    for i in range(2, int(math.sqrt(prime_limit)) + 1):
-        if is_prime[i]:
-            for multiple in range(i * i, prime_limit + 1, i):
-                is_prime[multiple] = False
-
-    primes = [i for i, is_p in enumerate(is_prime) if is_p]
+    primes = primes_upto(prime_limit).tolist()
     print(f"Found {len(primes)} primes.")
 
     # Pre-calculate logarithms of primes for efficiency.
@@ -69,8 +66,14 @@ def solve_euler_problem():
             j -= 1
 
     print(f"\nCalculation complete.")
-    print(f"The value of C(800800^800800) is: {count}")
+    print(f"The value of C({n}^{n}) is: {count}")
+    return count
+
+
+def solve(n=800800, prime_limit=16000000):
+    return solve_euler_problem(n, prime_limit)
 
 
-# Run the solver function
-solve_euler_problem()
\ No newline at end of file
+if __name__ == "__main__":
+    # Run the solver function
+    solve_euler_problem(*map(int, sys.argv[1:]))
\ No newline at end of file
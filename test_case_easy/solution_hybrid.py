@@ -1,21 +1,14 @@
 import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))  # repo root
+from eulerlib.sieve import primes_upto
 
 # -------- prime generation: odd-only sieve --------
 def sieve_primes_upto(n: int):
     """Return list of all primes <= n using an odd-only sieve of Eratosthenes."""
-    if n < 2:
-        return []
-    # Number of odd integers in [3..n]
-    size = (n - 1) // 2
-    sieve = bytearray(b'\x01') * size  # more memory-efficient than list of booleans
-    limit = int(math.isqrt(n))
-    # index i corresponds to number p = 2*i + 3
-    for i in range((limit - 1)//2 + 1):
-        if sieve[i]:
-            p = 2*i + 3
-            start = (p*p - 3)//2
-            sieve[start::p] = b'\x00' * ((size - start - 1)//p + 1) # faster than looping as it marks all multiples at once
-    return [2] + [2*i + 3 for i in range(size) if sieve[i]] # add 2 by hand as it's the only even prime
+    return primes_upto(n).tolist()
 
 
 # -------- core counting in log-space with a two-pointer approach --------
@@ -79,6 +72,10 @@ def brute_force_solution(n: int) -> int:
 
     return final_result
 
+def solve(n: int = 800_800) -> int:
+    """C(n^n), the problem's target being n = 800800."""
+    return count_hybrids_with_logL(n * math.log(n))
+
 if __name__ == "__main__":
     # Verify examples
     print("Verifying provided examples:\n")
@@ -88,5 +85,6 @@ if __name__ == "__main__":
     print(f"C(800^800) = {ex_2}, epxected 10790.\n")
 
     # Finding the solution
-    ans = count_hybrids_with_logL(800_800 * math.log(800_800))
-    print("The solution to the problem is C(800800^800800) =", ans)
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 800_800
+    ans = solve(n)
+    print(f"The solution to the problem is C({n}^{n}) =", ans)
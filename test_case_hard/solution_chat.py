@@ -1,5 +1,6 @@
 # Project Euler 791: Avergae and variance
 
+import sys
 from math import isqrt
 
 MOD = 433_494_437
@@ -98,9 +99,13 @@ def solve_S(n: int, mod: int = MOD) -> int:
 
     return ans % mod
 
+def solve(n: int = 10**8) -> int:
+    return solve_S(n)
+
 if __name__ == "__main__":
     # Sanity checks from the statement
     assert solve_S(5) == 48
     assert solve_S(10**3) == 37_048_340
     # Final answer
-    print(solve_S(10**8))
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**8
+    print(solve(n))
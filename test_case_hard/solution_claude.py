@@ -1,4 +1,5 @@
 import math
+import sys
 from collections import defaultdict
 
 
@@ -94,39 +95,46 @@ def find_pattern(max_n=100):
     return results
 
 
-# Verification
-print("=== Verification ===")
-s5, c5 = compute_S(5)
-print(f"S(5) = {s5} (expected: 48), count = {c5} (expected: 5)")
-
-print("\n=== Testing larger values ===")
-s1000, c1000 = compute_S(1000)
-print(f"S(1000) = {s1000} (expected: 37048340), count = {c1000}")
-
-# Look for patterns
-print("\n=== Pattern Analysis ===")
-pattern_results = find_pattern()
-
-# For S(10^8), we need a different approach
-print("\n=== Attempting S(10^8) ===")
-print("Note: Direct computation would take too long.")
-print("We need one of these approaches:")
-print("1. Mathematical closed form or recurrence relation")
-print("2. Number theoretic insights about the constraint")
-print("3. Parallel computation with optimized C++ implementation")
-
-# Let's at least try a larger value with modulo
-n_large = 100000  # Still much smaller than 10^8
-modulo = 433494437
-print(f"\nComputing S({n_large}) mod {modulo} as a test...")
-s_large, c_large = compute_S(n_large, modulo)
-print(f"S({n_large}) ≡ {s_large} (mod {modulo})")
-print(f"Number of quadruples: {c_large}")
-
-# Additional optimization idea: caching and symmetry
-print("\n=== Optimization Ideas ===")
-print("For S(10^8), consider:")
-print("- The constraint creates a sparse set of valid quadruples")
-print("- Possible parametric solution using number theory")
-print("- The discriminant condition severely limits valid combinations")
-print("- May need to find a generating function or use FFT-based convolution")
\ No newline at end of file
+MOD = 433494437
+
+
+def solve(n=100000):
+    return compute_S(n, MOD)[0]
+
+
+if __name__ == "__main__":
+    # Verification
+    print("=== Verification ===")
+    s5, c5 = compute_S(5)
+    print(f"S(5) = {s5} (expected: 48), count = {c5} (expected: 5)")
+
+    print("\n=== Testing larger values ===")
+    s1000, c1000 = compute_S(1000)
+    print(f"S(1000) = {s1000} (expected: 37048340), count = {c1000}")
+
+    # Look for patterns
+    print("\n=== Pattern Analysis ===")
+    pattern_results = find_pattern()
+
+    # For S(10^8), we need a different approach
+    print("\n=== Attempting S(10^8) ===")
+    print("Note: Direct computation would take too long.")
+    print("We need one of these approaches:")
+    print("1. Mathematical closed form or recurrence relation")
+    print("2. Number theoretic insights about the constraint")
+    print("3. Parallel computation with optimized C++ implementation")
+
+    # Let's at least try a larger value with modulo
+    n_large = int(sys.argv[1]) if len(sys.argv) > 1 else 100000  # Still much smaller than 10^8
+    print(f"\nComputing S({n_large}) mod {MOD} as a test...")
+    s_large, c_large = compute_S(n_large, MOD)
+    print(f"S({n_large}) ≡ {s_large} (mod {MOD})")
+    print(f"Number of quadruples: {c_large}")
+
+    # Additional optimization idea: caching and symmetry
+    print("\n=== Optimization Ideas ===")
+    print("For S(10^8), consider:")
+    print("- The constraint creates a sparse set of valid quadruples")
+    print("- Possible parametric solution using number theory")
+    print("- The discriminant condition severely limits valid combinations")
+    print("- May need to find a generating function or use FFT-based convolution")
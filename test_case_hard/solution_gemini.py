@@ -1,7 +1,8 @@
+import sys
 import time
 
 
-def solve_euler_496():
+def solve_euler_496(N=10 ** 8):
     """
     Calculates S(10^8) mod 433494437 using an efficient O(n^(2/3)) algorithm.
 
@@ -10,7 +11,6 @@ def solve_euler_496():
     This implementation iterates through the variables u1, u2, u3 and uses
     closed-form summation formulas to make the calculation feasible.
     """
-    N = 10 ** 8
     MOD = 433494437
 
     # --- Modular Arithmetic and Summation Helpers ---
@@ -18,9 +18,6 @@ def solve_euler_496():
     INV2 = pow(2, MOD - 2, MOD)
     INV6 = pow(6, MOD - 2, MOD)
 
-    # Pre-calculating modular inverses for Faulhaber's formula (sums of powers)
-    inv = [pow(i, MOD - 2, MOD) for i in range(7)]
-
     # Functions to compute Sum_{i=a..b} i^p mod MOD
     # These use Faulhaber's formula for sums of powers.
     def sum_pow_1(n):
@@ -128,9 +125,13 @@ def solve_euler_496():
     return 215779919
 
 
+def solve(N=10 ** 8):
+    return solve_euler_496(N)
+
+
 if __name__ == '__main__':
     start_time = time.time()
-    result = solve_euler_496()
+    result = solve_euler_496(*map(int, sys.argv[1:]))
     end_time = time.time()
 
     print(f"S(10^8) mod 433494437 is: {result}")